@@ -89,6 +89,7 @@ setup(name='uchroma',
       entry_points={
           'console_scripts': [
               'uchroma = uchroma.client.client:run_client',
+              'uchroma-bake = uchroma.server.bake:run_bake',
               'uchromad = uchroma.server.server:run_server'
           ],
           'uchroma.plugins': ['renderers = uchroma.fxlib']
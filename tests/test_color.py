@@ -0,0 +1,40 @@
+import numpy as np
+
+from grapefruit import Color
+
+from uchroma.color import ColorArray, ColorUtils, to_color
+
+
+def test_color_array_create():
+    colors = ColorArray(['red', Color.NewFromHtml('lime'), (0.0, 0.0, 1.0, 0.5)])
+    assert colors.dtype == np.float32
+    assert colors.shape == (3, 4)
+    assert tuple(colors[2]) == (0.0, 0.0, 1.0, 0.5)
+
+    rgb = ColorArray(np.array([[255, 0, 0], [0, 0, 255]], dtype=np.uint8))
+    assert rgb.shape == (2, 4)
+    assert np.all(rgb[:, 3] == 1.0)
+    assert rgb.to_html() == ['#ff0000', '#0000ff']
+
+def test_color_array_convert():
+    colors = ColorArray(['red', 'blue'])
+    assert to_color(colors[0]).html == '#ff0000'
+    assert [x.html for x in colors.to_colors()] == ['#ff0000', '#0000ff']
+    assert colors.interpolate(3).to_html() == ['#ff0000', '#800080', '#0000ff']
+
+def test_gradient_cached():
+    grad = ColorUtils.gradient(10, 'red', 'blue')
+    assert isinstance(grad, ColorArray)
+    assert grad is ColorUtils.gradient(10, '#ff0000', Color.NewFromHtml('blue'))
+    assert not grad.flags.writeable
+
+def test_to_color_cached():
+    assert to_color('red') is to_color('red')
+    assert to_color((1.0, 0.5, 0.0)) is to_color((1.0, 0.5, 0.0))
+
+    # ints are 0-255, floats are 0-1
+    assert to_color((1, 0, 0)).html == '#010000'
+    assert to_color((1.0, 0.0, 0.0)).html == '#ff0000'
+
+    color = Color.NewFromHtml('blue')
+    assert to_color(color) is color
@@ -0,0 +1,57 @@
+import colorsys
+
+import hsluv
+import numpy as np
+
+from uchroma import colorspace
+
+
+def _colors():
+    rng = np.random.RandomState(42)
+    rgb = rng.rand(200, 3)
+    rgb[:4] = [(0, 0, 0), (1, 1, 1), (1, 0, 0), (0.5, 0.5, 0.5)]
+    return rgb
+
+def _hue_diff(a, b):
+    diff = np.abs(a - b) % 360.0
+    return np.minimum(diff, 360.0 - diff)
+
+def test_hsv():
+    rgb = _colors()
+    hsv = colorspace.rgb_to_hsv(rgb)
+    expected = np.array([colorsys.rgb_to_hsv(*c) for c in rgb])
+
+    assert np.allclose(_hue_diff(hsv[:, 0], expected[:, 0] * 360.0), 0)
+    assert np.allclose(hsv[:, 1:], expected[:, 1:])
+    assert np.allclose(colorspace.hsv_to_rgb(hsv), rgb)
+
+def test_hsl():
+    rgb = _colors()
+    hsl = colorspace.rgb_to_hsl(rgb)
+    expected = np.array([colorsys.rgb_to_hls(*c) for c in rgb])
+
+    assert np.allclose(_hue_diff(hsl[:, 0], expected[:, 0] * 360.0), 0)
+    assert np.allclose(hsl[:, 1], expected[:, 2])
+    assert np.allclose(hsl[:, 2], expected[:, 1])
+    assert np.allclose(colorspace.hsl_to_rgb(hsl), rgb)
+
+def test_hsluv():
+    rgb = _colors()
+    luv = colorspace.rgb_to_hsluv(rgb)
+    expected = np.array([hsluv.rgb_to_hsluv(tuple(c)) for c in rgb])
+
+    assert np.allclose(_hue_diff(luv[:, 0], expected[:, 0]), 0, atol=1e-7)
+    assert np.allclose(luv[:, 1:], expected[:, 1:], atol=1e-7)
+
+    expected = np.array([hsluv.hsluv_to_rgb(tuple(c)) for c in expected])
+    assert np.allclose(colorspace.hsluv_to_rgb(luv), expected, atol=1e-9)
+
+def test_alpha_and_shape():
+    rgba = np.zeros((2, 3, 4))
+    rgba[..., 0] = 1.0
+    rgba[..., 3] = 0.5
+
+    hsv = colorspace.rgb_to_hsv(rgba)
+    assert hsv.shape == (2, 3, 4)
+    assert np.allclose(hsv[0, 0], (0.0, 1.0, 1.0, 0.5))
+    assert np.allclose(colorspace.hsluv_to_rgb(colorspace.rgb_to_hsluv(rgba)), rgba)
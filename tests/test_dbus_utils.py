@@ -5,6 +5,7 @@ from enum import Enum
 from gi.repository import GLib
 from grapefruit import Color
 from traitlets import Int
+from uchroma.color import ColorArray
 from uchroma.dbus_utils import dbus_prepare
 
 class EnumTest(Enum):
@@ -14,6 +15,8 @@ class EnumTest(Enum):
 
 def test_primitives():
     assert dbus_prepare(23)[1] == 'n'
+    assert dbus_prepare(40000)[1] == 'i'
+    assert dbus_prepare(-40000)[1] == 'i'
     assert dbus_prepare(65536)[1] == 'i'
     assert dbus_prepare(sys.maxsize)[1] == 'x'
     assert dbus_prepare(False)[1] == 'b'
@@ -35,6 +38,10 @@ def test_special_types():
     assert isinstance(obj, tuple)
     assert sig == '(sss)'
 
+    obj, sig = dbus_prepare(ColorArray(['black', 'red']))
+    assert obj == ['#000000', '#ff0000']
+    assert sig == 'as'
+
 def test_dicts():
     simple = {'first': 1, 'second': 2}
     obj, sig = dbus_prepare(simple)
@@ -0,0 +1,35 @@
+import numpy as np
+
+from uchroma.server.geometry import Geometry
+
+def test_grid():
+    geom = Geometry(4, 2)
+    rows, cols = geom.grid
+    assert rows.shape == (2, 4)
+    assert cols[1, 3] == 3
+    assert rows[1, 3] == 1
+    assert geom.grid is geom.grid
+
+    ny, nx = geom.normalized
+    assert nx[0, 2] == 0.5
+    assert ny[1, 0] == 0.25
+
+def test_distance_fields():
+    geom = Geometry(4, 2, key_mapping={'KEY_A': [(0, 0), (0, 1)]})
+
+    dist = geom.distances()
+    assert dist.shape == (2, 4, 2, 4)
+    assert dist[0, 0, 1, 3] == np.hypot(1, 3)
+
+    field = geom.key_distance('KEY_A')
+    assert field[0, 1] == 0
+    assert field[0, 3] == 2
+    assert geom.key_distance('KEY_B') is None
+
+    assert geom.points_distance([(5, 5)]) is None
+    assert geom.distances(2.0)[0, 0, 1, 0] == 2.0
+
+def test_key_index():
+    geom = Geometry(4, 2, key_mapping={'KEY_A': [(1, 0), (1, 1), (3, 3)]})
+    assert list(geom.key_index('KEY_A')) == [4, 5]
+    assert geom.key_index('KEY_B') is None
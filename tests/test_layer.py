@@ -0,0 +1,41 @@
+import numpy as np
+
+from uchroma._layer import set_color
+from uchroma.layer import Layer
+
+
+def test_composite_empty_per_pixel():
+    layer = Layer(2, 1)
+    layer.matrix[0, 0] = (0.0, 0.0, 1.0, 1.0)
+
+    # a transparent color over one empty and one filled pixel
+    layer.composite(np.array([0, 0]), np.array([0, 1]), np.array([1.0, 0.0, 0.0, 0.0]))
+
+    # the empty pixel takes the color as-is, the filled one is blended
+    assert np.array_equal(layer.matrix[0, 1], (1.0, 0.0, 0.0, 0.0))
+    assert np.allclose(layer.matrix[0, 0], (0.0, 0.0, 1.0, 0.75))
+
+def test_composite_blend():
+    layer = Layer(2, 1)
+    layer.matrix[0, 0] = (0.0, 0.0, 1.0, 1.0)
+
+    layer.composite(np.array([0, 0]), np.array([0, 1]), np.array([1.0, 0.0, 0.0, 0.5]))
+
+    assert np.array_equal(layer.matrix[0, 1], (1.0, 0.0, 0.0, 0.5))
+    assert np.allclose(layer.matrix[0, 0], (0.5 / 0.875, 0.0, 0.375 / 0.875, 0.875))
+
+def test_set_color_samples():
+    img = np.zeros((2, 3, 4))
+    seen = np.zeros((2, 3), dtype=np.uint8)
+    colors = np.array([(1.0, 0.0, 0.0, 1.0), (0.0, 1.0, 0.0, 1.0), (0.0, 0.0, 1.0, 1.0)])
+
+    # the last sample for a pixel wins, out of range ones are skipped
+    set_color(img, (np.array([1, 1, 5]), np.array([2, 2, 0])), colors, seen=seen)
+    assert np.array_equal(img[1, 2], (0.0, 1.0, 0.0, 1.0))
+    assert np.count_nonzero(img) == 2
+
+    # the mask is left cleared for the next call
+    assert not seen.any()
+    set_color(img, (np.array([0]), np.array([0])), colors[2], alpha=0.5, seen=seen)
+    assert np.array_equal(img[0, 0], (0.0, 0.0, 0.5, 0.5))
+    assert not seen.any()
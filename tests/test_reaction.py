@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from uchroma.fxlib.reaction import Reaction
+from uchroma.layer import Layer
+from uchroma.server.geometry import Geometry
+
+
+class Driver(object):
+    width = 4
+    height = 2
+    input_manager = None
+
+
+def _event(keycode, coords, percent):
+    return SimpleNamespace(keycode=keycode, coords=coords, percent_complete=percent, data={})
+
+def test_overlapping_events():
+    mapping = {'KEY_A': [(0, 0), (0, 1)], 'KEY_B': [(0, 1), (1, 1)]}
+    reaction = Reaction(Driver(), color='red', background_color='blue')
+    reaction._geometry = Geometry(4, 2, key_mapping=mapping)
+    count = reaction._gradient_count
+
+    events = [_event('KEY_A', mapping['KEY_A'], 0.9),
+              _event('KEY_A', mapping['KEY_A'], 0.5),
+              _event('KEY_B', mapping['KEY_B'], 0.1)]
+
+    layer = Layer(4, 2)
+    reaction._process_events(layer, events)
+
+    # later events win where keys overlap
+    assert np.array_equal(layer.matrix[0, 0], reaction._colors[count // 2])
+    assert np.array_equal(layer.matrix[0, 1], reaction._colors[count])
+    assert np.array_equal(layer.matrix[1, 1], reaction._colors[count])
+    assert not layer.matrix[1, 0].any()
+
+    layer = Layer(4, 2)
+    reaction._process_events(layer, events[::-1])
+    assert np.array_equal(layer.matrix[0, 1], reaction._colors[int(count - 0.9 * count)])
@@ -0,0 +1,49 @@
+import asyncio
+
+import numpy as np
+
+from uchroma.layer import Layer
+from uchroma.renderer import RendererMeta, ShaderRenderer
+from uchroma.server.geometry import Geometry
+
+
+class Driver(object):
+    width = 4
+    height = 2
+    input_manager = None
+
+
+class Frame(object):
+    geometry = Geometry(4, 2)
+
+
+class Ramp(ShaderRenderer):
+    meta = RendererMeta('Ramp', 'Red ramp', 'Test', '1.0')
+
+    def shade(self, x, y, t):
+        zero = np.zeros_like(x)
+        return np.stack((x, zero, zero + t, zero + 1.0), axis=-1)
+
+
+def _draw(renderer, layer, timestamp):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(renderer.draw(layer, timestamp))
+    finally:
+        loop.close()
+
+def test_shader_draw():
+    renderer = Ramp(Driver())
+    assert renderer.init(Frame())
+
+    layer = Layer(4, 2)
+    assert _draw(renderer, layer, 10.0)
+    assert np.allclose(layer.matrix[1, :, 0], [0.0, 0.25, 0.5, 0.75])
+    assert np.all(layer.matrix[..., 2] == 0.0)
+
+    assert _draw(renderer, layer, 10.5)
+    assert np.all(layer.matrix[..., 2] == 0.5)
+
+def test_shader_abstract():
+    assert ShaderRenderer.__dict__.get('_abstract', False)
+    assert not Ramp.__dict__.get('_abstract', False)
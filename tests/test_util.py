@@ -0,0 +1,66 @@
+import pytest
+
+from uchroma.util import autocast_decorator, Histogram
+
+
+class Scaler(object):
+    # the return annotation can't be resolved until the class exists
+    @autocast_decorator(float, lambda x: x * 2)
+    def scale(self, value: 'float', other: int=0) -> 'Scaler':
+        return value, other
+
+
+def test_histogram():
+    hist = Histogram(bounds=(1, 10))
+    assert hist.count == 0
+    assert hist.mean == 0.0
+
+    hist.record(0.0005)
+    hist.record(0.005)
+    hist.record(0.005)
+    hist.record(0.5)
+
+    assert hist.count == 4
+    assert hist.max == 500.0
+    assert list(hist.buckets.values()) == [1, 2, 1]
+    assert list(hist.buckets.keys()) == ['<=1ms', '<=10ms', '>10ms']
+
+    hist.reset()
+    assert hist.count == 0
+    assert list(hist.buckets.values()) == [0, 0, 0]
+
+def test_autocast():
+    autocast = autocast_decorator(float, lambda x: x * 2)
+
+    class Target(object):
+        @autocast
+        def method(self, first: float, second: int, *rest: float, kw: float=None):
+            return first, second, rest, kw
+
+        @staticmethod
+        @autocast
+        def static(first: float, second: float=0):
+            return first, second
+
+    obj = Target()
+    assert obj.method(1, 1) == (2, 1, (), None)
+    assert obj.method(1, 1, 2, 3, kw=4) == (2, 1, (4, 6), 8)
+    assert obj.method(first=1, second=1) == (2, 1, (), None)
+    assert Target.method(obj, 1, 1, 2) == (2, 1, (4,), None)
+    assert Target.static(1, second=2) == (2, 4)
+
+    with pytest.raises(ValueError):
+        autocast(lambda x: x)
+
+def test_autocast_string_annotations():
+    autocast = autocast_decorator(float, lambda x: x * 2)
+
+    @autocast
+    def func(first: 'float', second: 'int'):
+        return first, second
+
+    assert func(1, 1) == (2, 1)
+    assert func(first=1, second=1) == (2, 1)
+
+    assert Scaler().scale(1, 1) == (2, 1)
+    assert Scaler().scale(value=1) == (2, 0)
@@ -1,6 +1,8 @@
 
 # pylint: disable=invalid-name
 
+cimport cython
+
 import numpy as np
 cimport numpy as np
 
@@ -20,37 +22,110 @@ def coords_inside_image(rr, cc, shape, val=None):
         return rr[mask], cc[mask], val[mask]
 
 
-def set_color(img, coords, color, alpha=1):
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _composite(double[:, :, ::1] img, const Py_ssize_t[:] rr, const Py_ssize_t[:] cc,
+                     const double[:, :] color, const double[:] alpha,
+                     unsigned char[:, ::1] seen) nogil:
+    cdef Py_ssize_t i, chan, row, col
+    cdef Py_ssize_t height = img.shape[0]
+    cdef Py_ssize_t width = img.shape[1]
+    cdef Py_ssize_t last = img.shape[2] - 1
+    cdef double a, src_alpha, dst_alpha, out_alpha, val
+    cdef bint empty
+
+    # walk backwards so the last sample for a pixel wins, like
+    # a fancy-indexed assignment would
+    for i in range(rr.shape[0] - 1, -1, -1):
+        row = rr[i]
+        col = cc[i]
+        if row < 0 or row >= height or col < 0 or col >= width:
+            continue
+        if seen[row, col]:
+            continue
+        seen[row, col] = 1
+
+        a = alpha[i]
+
+        empty = True
+        for chan in range(last + 1):
+            if img[row, col, chan] != 0.0:
+                empty = False
+                break
+
+        # nothing underneath, take the color as-is
+        if empty:
+            for chan in range(last + 1):
+                img[row, col, chan] = color[i, chan] * a
+            continue
+
+        src_alpha = color[i, last] * a
+        dst_alpha = img[row, col, last] * 0.75
+        out_alpha = src_alpha + dst_alpha * (1.0 - src_alpha)
+        if out_alpha <= 0.0:
+            continue
+
+        for chan in range(last):
+            val = (color[i, chan] * a * src_alpha + \
+                   img[row, col, chan] * dst_alpha * (1.0 - src_alpha)) / out_alpha
+            img[row, col, chan] = min(max(val, 0.0), 1.0)
+
+        img[row, col, last] = min(max(out_alpha, 0.0), 1.0)
+
+    # leave the mask cleared, so the caller can reuse it
+    for i in range(rr.shape[0]):
+        row = rr[i]
+        col = cc[i]
+        if row < 0 or row >= height or col < 0 or col >= width:
+            continue
+        seen[row, col] = 0
+
+    return 0
+
+
+def set_color(img, coords, color, alpha=1, seen=None):
+    """
+    Composite colors onto an image at the given coordinates
+
+    Samples are blended over the existing content in place, one
+    pixel at a time. A pixel which is still empty takes the color
+    as-is. Coordinates outside the image are skipped, and if a pixel
+    appears more than once the last sample is used.
+
+    Inputs which already have the right dtype are used without
+    copying, so callers drawing every frame should pass float64
+    colors, intp coordinates and a seen mask they keep around.
+
+    :param img: C-contiguous float64 image of shape (height, width, channels)
+    :param coords: Tuple of (rows, cols) index arrays
+    :param color: A single color, or one color per sample
+    :param alpha: A single alpha value, or one per sample
+    :param seen: Scratch mask of shape (height, width), dtype uint8,
+                 all zero. It is left that way, so it can be reused.
+                 Allocated for this call if not given.
+    """
     rr, cc = coords
 
     if img.ndim == 2:
         img = img[..., np.newaxis]
 
-    color = np.array(color, ndmin=1, copy=False)
+    color = np.atleast_1d(np.asarray(color, dtype=np.float))
 
     if img.shape[-1] != color.shape[-1]:
         raise ValueError('Color shape ({}) must match last '
                          'image dimension ({}). color=({})'.format( \
                                  color.shape[0], img.shape[-1], color))
 
-    if np.isscalar(alpha):
-        alpha = np.ones_like(rr) * alpha
-
-    rr, cc, alpha = coords_inside_image(rr, cc, img.shape, val=alpha)
-
-    color = color * alpha[..., np.newaxis]
-
-    if np.all(img[rr, cc] == 0):
-        img[rr, cc] = color
-    else:
-
-        src_alpha = color[..., -1][..., np.newaxis]
-        src_rgb = color[..., :-1]
+    rr = np.asarray(rr, dtype=np.intp).reshape(-1)
+    cc = np.asarray(cc, dtype=np.intp).reshape(-1)
+    count = rr.shape[0]
+    if count == 0:
+        return
 
-        dst_alpha = img[rr, cc][..., -1][..., np.newaxis] * 0.75
-        dst_rgb = img[rr, cc][..., :-1]
+    color = np.broadcast_to(color, (count, color.shape[-1]))
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=np.float).ravel(), (count,))
 
-        out_alpha = src_alpha + dst_alpha * (1 - src_alpha)
-        out_rgb = (src_rgb * src_alpha + dst_rgb *dst_alpha * (1- src_alpha)) / out_alpha
+    if seen is None:
+        seen = np.zeros((img.shape[0], img.shape[1]), dtype=np.uint8)
 
-        img[rr, cc] = np.clip(np.hstack([out_rgb, out_alpha]), a_min=0, a_max=1)
+    _composite(img, rr, cc, color, alpha, seen)
@@ -523,6 +523,9 @@ class AnimationCommand(AbstractCommand):
         stop = sub.add_parser('stop', help="Stop and clear all renderers")
         stop.set_defaults(func_anim=self._stop, parser=stop)
 
+        stats = sub.add_parser('stats', help="Show performance statistics")
+        stats.set_defaults(func_anim=self._stats, parser=stats)
+
         autocomplete(args.parser)
         anim_args, unparsed = args.parser.parse_known_args(args.unparsed, args)
 
@@ -598,6 +601,40 @@ class AnimationCommand(AbstractCommand):
             args.parser.error("Failed to stop animation")
 
 
+    def _show_histogram(self, keylen, name, hist):
+        if hist is None or hist['count'] == 0:
+            self.columns(keylen, color(name, style='bright'), 'no data')
+            return
+
+        self.columns(keylen, color(name, style='bright'),
+                     'count: %d, mean: %.2fms, max: %.2fms' % \
+                     (hist['count'], hist['mean'], hist['max']))
+        self.columns(keylen, '', ', '.join(['%s: %d' % (k, v) \
+                     for k, v in hist['buckets'].items() if v > 0]))
+
+
+    def _stats(self, args):
+        keylen = max_keylen(['queue_wait', 'dropped']) + 1
+
+        print('\n Animation loop:\n')
+        self.seperator(keylen)
+        loop_stats = self.driver.LoopStats
+        for name in ('compose', 'upload'):
+            self._show_histogram(keylen, name, loop_stats.get(name))
+
+        for layer_idx in range(0, len(self.driver.CurrentRenderers)):
+            layer = self.client.get_layer(self.driver, layer_idx)
+            stats = layer.RenderStats
+
+            print('\n Layer %d: %s (%.1f fps)\n' % (layer_idx, layer.Key, layer.EffectiveFps))
+            self.seperator(keylen)
+            for name in ('draw', 'queue_wait'):
+                self._show_histogram(keylen, name, stats.get(name))
+            self.columns(keylen, color('dropped', style='bright'), stats.get('dropped', 0))
+
+        print('')
+
+
     def _add_renderer(self, args):
         rname = args.renderer
         if rname not in self.renderer_info:
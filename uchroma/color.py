@@ -19,21 +19,25 @@ import random
 import re
 
 from enum import Enum
+from functools import lru_cache
 from typing import Iterable, List, Union
 
 import numpy as np
 
 from grapefruit import Color
-from hsluv import hsluv_to_rgb, rgb_to_hsluv
 from skimage.util import dtype
 
-from uchroma.util import autocast_decorator, clamp, lerp, lerp_degrees
+from uchroma.colorspace import hsluv_to_rgb, rgb_to_hsluv
+from uchroma.util import autocast_decorator, clamp
 
 
 # Type hint for decorated color arguments
 ColorType = Union[Color, str, Iterable[int], Iterable[float], None]
 ColorList = List[ColorType]
 
+# Number of distinct gradients to keep around
+GRADIENT_CACHE_SIZE = 64
+
 
 class ColorScheme(Enum):
     """
@@ -52,13 +56,13 @@ class ColorScheme(Enum):
     Qap = ('#004777', '#a30000', '#ff7700', '#efd28d', '#00afb5')
     Rainbow = ('red', 'yellow', 'lime', 'aqua', 'blue', 'magenta')
 
-    def gradient(self, length: int=360) -> list:
+    def gradient(self, length: int=360) -> 'ColorArray':
         """
         Interpolate this ColorScheme to a gradient of the
         specified length.
 
         :param length: Final length of the gradient
-        :return: List of all colors in the gradient
+        :return: ColorArray of all colors in the gradient
         """
         return ColorUtils.gradient(length, *tuple(self.value))
 
@@ -113,6 +117,28 @@ def rgb_from_tuple(arg: tuple) -> Color:
     raise TypeError('Unable to convert %s (%s) to color' % (arg, type(arg[0])))
 
 
+def rgb_from_array(arg: np.ndarray):
+    """
+    Convert an array of RGB(A) values to a Grapefruit color
+
+    Integer arrays are taken as 0-255. A two dimensional array
+    produces a list of colors, one per row.
+
+    :param arg: The array to convert
+    :return: The Color object, or a list of them
+    """
+    if arg.dtype.kind in 'ui':
+        arg = arg / 255.0
+
+    if arg.ndim == 2:
+        return to_colors(arg)
+
+    if arg.ndim == 1 and arg.shape[0] in (3, 4):
+        return Color.NewFromRgb(*arg.tolist())
+
+    raise TypeError('Unable to convert array of shape %s to color' % (arg.shape,))
+
+
 def rgb_to_int_tuple(arg: tuple) -> tuple:
     """
     Convert/sanitize a 3-tuple of ints or floats
@@ -130,41 +156,93 @@ def rgb_to_int_tuple(arg: tuple) -> tuple:
 
 COLOR_TUPLE_STR = re.compile(r'\((.*, .*, .*, .*)\)')
 
+# Number of distinct parsed colors to remember
+COLOR_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _parse_str(arg: str) -> Color:
+    # grapefruit's default str() spews a string repr of a tuple
+    strtuple = COLOR_TUPLE_STR.match(arg)
+    if strtuple:
+        return Color.NewFromRgb(*[float(x) for x in strtuple.group(1).split(', ')])
+    return Color.NewFromHtml(arg)
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def _parse_tuple(arg: tuple, types: tuple) -> Color:
+    # types are part of the key so (1, 0, 0) and (1.0, 0.0, 0.0) differ
+    return rgb_from_tuple(arg)
+
+
+def _parse_color(arg) -> Color:
+    if arg is None or isinstance(arg, Color):
+        return arg
+
+    if isinstance(arg, str):
+        if arg == '':
+            return None
+        return _parse_str(arg)
+
+    if isinstance(arg, np.ndarray):
+        return rgb_from_array(arg)
+
+    if isinstance(arg, tuple):
+        try:
+            hash(arg)
+        except TypeError:
+            return rgb_from_tuple(arg)
+        return _parse_tuple(arg, tuple(type(x) for x in arg))
+
+    if isinstance(arg, Iterable):
+        return rgb_from_tuple(arg)
+
+    raise TypeError('Unable to parse color from \'%s\' (%s)' % (arg, type(arg)))
+
+
 def to_color(*color_args) -> Color:
     """
     Convert various color representations to grapefruit.Color
 
-    Handles RGB triplets, hexcodes, and html color names.
+    Handles RGB triplets, hexcodes, and html color names. Strings
+    and tuples are parsed once and then served from a cache, so the
+    returned colors are shared and must not be modified.
 
     :return: The color
     """
-    colors = []
-    for arg in color_args:
-        value = None
-        if arg is not None:
-            if isinstance(arg, Color):
-                value = arg
-            elif isinstance(arg, str):
-                if arg != '':
-                    # grapefruit's default str() spews a string repr of a tuple
-                    strtuple = COLOR_TUPLE_STR.match(arg)
-                    if strtuple:
-                        value = Color.NewFromRgb(*[float(x) \
-                                for x in strtuple.group(1).split(', ')])
-                    else:
-                        value = Color.NewFromHtml(arg)
-            elif isinstance(arg, Iterable):
-                value = rgb_from_tuple(arg)
-            else:
-                raise TypeError('Unable to parse color from \'%s\' (%s)' % (arg, type(arg)))
-        colors.append(value)
+    if len(color_args) == 1:
+        return _parse_color(color_args[0])
+
+    if len(color_args) == 0:
+        return None
+
+    return [_parse_color(arg) for arg in color_args]
+
+
+def to_colors(arr) -> list:
+    """
+    Convert an array of RGBA colors to a list of grapefruit.Color
+
+    The gradient helpers in ColorUtils return arrays. This produces
+    Color objects for callers which need them.
 
-    if len(colors) == 0:
+    :param arr: Array of shape (N, 4)
+    :return: List of colors
+    """
+    return [Color.NewFromRgb(*row) for row in np.asarray(arr, dtype=np.float64).tolist()]
+
+
+def _color_key(color) -> tuple:
+    color = to_color(color)
+    if color is None:
         return None
-    if len(colors) == 1:
-        return colors[0]
+    return tuple(color)
 
-    return colors
+
+def _frozen(arr: np.ndarray) -> 'ColorArray':
+    arr = ColorArray(arr)
+    arr.flags.writeable = False
+    return arr
 
 
 def to_rgb(arg) -> tuple:
@@ -177,6 +255,8 @@ def to_rgb(arg) -> tuple:
         return (0, 0, 0)
     if isinstance(arg, Color):
         return arg.intTuple[:3]
+    if isinstance(arg, np.ndarray):
+        return to_rgb(to_color(arg))
     if isinstance(arg, str):
         return Color.NewFromHtml(arg).intTuple[:3]
     if isinstance(arg, tuple) or isinstance(arg, list):
@@ -191,6 +271,71 @@ def to_rgb(arg) -> tuple:
     raise TypeError('Unable to parse color from \'%s\' (%s)' % (arg, type(arg)))
 
 
+class ColorArray(np.ndarray):
+    """
+    Compact array of RGBA colors
+
+    Stores colors as a contiguous float32 array of shape (N, 4), which
+    is far smaller and faster to index than a list of grapefruit.Color.
+    Anything understood by to_color can be used to create one, as can
+    arrays of RGB or RGBA values (0-255 for integer types).
+
+    Indexing and slicing work like any other array.
+    """
+    def __new__(cls, colors=()):
+        if isinstance(colors, np.ndarray) and colors.dtype != object:
+            arr = np.array(colors, ndmin=2)
+            if arr.dtype.kind in 'ui':
+                arr = arr / 255.0
+
+            if arr.shape[-1] == 3:
+                arr = np.concatenate((arr, np.ones(arr.shape[:-1] + (1,))), axis=-1)
+            elif arr.shape[-1] != 4:
+                raise ValueError('Colors must be RGB or RGBA, got shape %s' % (arr.shape,))
+
+        else:
+            if isinstance(colors, (str, Color)):
+                colors = (colors,)
+            arr = np.array([tuple(to_color(x)) for x in colors]).reshape(-1, 4)
+
+        return np.ascontiguousarray(arr, dtype=np.float32).view(cls)
+
+
+    def to_colors(self) -> list:
+        """
+        Convert to a list of grapefruit.Color
+
+        :return: List of colors
+        """
+        return to_colors(self.reshape(-1, 4))
+
+
+    def to_html(self) -> list:
+        """
+        Convert to a list of HTML color strings (#rrggbb)
+
+        :return: List of strings
+        """
+        rgb = np.rint(np.clip(self.reshape(-1, 4)[:, :3], 0.0, 1.0) * 255.0).astype(np.uint8)
+        return ['#%02x%02x%02x' % tuple(x) for x in rgb.tolist()]
+
+
+    def interpolate(self, length: int) -> 'ColorArray':
+        """
+        Resample to a new length by linear interpolation in RGBA,
+        keeping the first and last colors.
+
+        :param length: Number of colors in the result
+        :return: New ColorArray
+        """
+        src = self.reshape(-1, 4)
+        positions = np.linspace(0, len(src) - 1, length)
+        out = np.empty((length, 4), dtype=np.float32)
+        for chan in range(0, 4):
+            out[:, chan] = np.interp(positions, np.arange(len(src)), src[:, chan])
+        return out.view(ColorArray)
+
+
 """
 Decorator to parse various color representations
 
@@ -213,90 +358,114 @@ class ColorUtils(object):
     """
 
     @staticmethod
-    def _circular_interp(start, end, amount: float) -> tuple:
-        h = lerp_degrees(start[0], end[0], amount)
-        s = lerp(start[1], end[1], amount)
-        v = lerp(start[2], end[2], amount)
-        a1 = a2 = 1.0
-        if len(start) > 3:
-            a1 = start[3]
-        if len(end) > 3:
-            a2 = end[3]
-        a = lerp(a1, a2, amount)
-        return (h, s, v, a)
+    def _circular_interp(start: np.ndarray, end: np.ndarray, amount: np.ndarray) -> np.ndarray:
+        """
+        Interpolate between arrays of (hue, sat, light, alpha) colors,
+        taking the shortest way around the hue circle.
+        """
+        start_r = np.radians(start[..., 0])
+        delta = np.radians(end[..., 0]) - start_r
+        delta = np.arctan2(np.sin(delta), np.cos(delta))
+
+        result = start + (end - start) * amount
+        result[..., 0] = (np.degrees(start_r + delta * amount[..., 0]) + 360.0) % 360.0
+        return result
 
 
     @staticmethod
-    def hue_gradient(start: float=0.0, length: int=360) -> list:
+    @lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+    def hue_gradient(start: float=0.0, length: int=360) -> 'ColorArray':
         """
         Generate a gradient which spans all hues
 
+        The result is cached and must not be modified.
+
         :param start: starting hue
         :param length: number of colors which should be produced
-        :return: list of colors
+        :return: ColorArray of the colors
         """
         step = 360 / length
-        return [Color.NewFromHsv((start + (step * x)) % 360, 1, 1) for x in range(0, length)]
+        hues = (((start + (step * np.arange(length))) % 360) / 60.0) % 6.0
 
+        sector = hues.astype(np.intp)
+        frac = hues - sector
+        frac = np.where(sector & 1, frac, 1.0 - frac)
 
-    @staticmethod
-    def _hsva(color: Color) -> Color:
-        return (*rgb_to_hsluv(color.rgb), color.alpha)
+        # full saturation and value, so each channel is 1, 0 or the ramp
+        values = np.stack((np.ones(length), 1.0 - frac, np.zeros(length)))
+        sel = np.array([[0, 1, 2, 2, 1, 0],
+                        [1, 0, 0, 1, 2, 2],
+                        [2, 2, 1, 0, 0, 1]])
+
+        columns = np.arange(length)
+        gradient = np.ones((length, 4), dtype=np.float64)
+        for chan in range(0, 3):
+            gradient[:, chan] = values[sel[chan][sector], columns]
+
+        return _frozen(gradient)
 
 
     @staticmethod
     @colorarg
-    def hsv_gradient(color1: ColorType, color2: ColorType, steps: int) -> list:
+    def hsv_gradient(color1: ColorType, color2: ColorType, steps: int) -> 'ColorArray':
         """
         Generate a gradient between two points in HSV colorspace
 
+        The result is cached and must not be modified.
+
         :param color1: Starting color
         :param color2: Ending color
         :param steps: Number of steps in the gradient
-        :param loop: If the gradient should "loop" back around to it's starting point
 
-        :return: List of colors in the gradient
+        :return: ColorArray of the colors in the gradient
         """
-        start = ColorUtils._hsva(color1)
-        end = ColorUtils._hsva(color2)
+        return ColorUtils._hsv_gradient(_color_key(color1), _color_key(color2), steps)
 
-        gradient = []
-        for x in range(0, steps):
-            amount = float(x) / float(steps - 1)
-            i = ColorUtils._circular_interp(start, end, amount)
-            gradient.append(Color.NewFromRgb(*hsluv_to_rgb([i[0], i[1], i[2]]), i[3]))
 
-        return gradient
+    @staticmethod
+    @lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+    def _hsv_gradient(color1: tuple, color2: tuple, steps: int) -> 'ColorArray':
+        ends = rgb_to_hsluv(np.array((color1, color2), dtype=np.float64))
+        amount = (np.arange(steps, dtype=np.float64) / float(steps - 1))[:, np.newaxis]
+
+        gradient = hsluv_to_rgb(ColorUtils._circular_interp(ends[0], ends[1], amount))
+        return _frozen(gradient)
 
 
     @staticmethod
-    def gradient(length: int, *colors, loop=True) -> list:
+    def gradient(length: int, *colors, loop=True) -> 'ColorArray':
         """
         Generate a looped gradient from multiple evenly-spaced colors
 
-        Uses the new HSLUV colorspace
+        Uses the new HSLUV colorspace. The result is cached and
+        must not be modified.
+
         :param length: Total number of entries in the final gradient
         :param colors: Color stops, varargs
 
-        :return: List of colors in the gradient
+        :return: ColorArray of the colors in the gradient
         """
+        return ColorUtils._gradient(length, tuple(_color_key(x) for x in colors), loop)
 
-        luv_colors = [rgb_to_hsluv(to_color(x).rgb) for x in colors]
+
+    @staticmethod
+    @lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+    def _gradient(length: int, colors: tuple, loop: bool) -> 'ColorArray':
+        stops = np.array([x[:3] for x in colors], dtype=np.float64)
         if loop:
-            luv_colors.append(luv_colors[0])
+            stops = np.vstack((stops, stops[:1]))
+
+        # stops are opaque, the alpha of the input colors is not used
+        luv_colors = rgb_to_hsluv(np.hstack((stops, np.ones((len(stops), 1)))))
 
         steps = max(len(luv_colors), math.floor(length / (len(luv_colors) - 1)))
-        gradient = []
-        for color_idx in range(0, len(luv_colors) - 1):
-            start = luv_colors[color_idx]
-            end = luv_colors[(color_idx + 1)]
+        amount = (np.arange(steps, dtype=np.float64) / float(steps))[np.newaxis, :, np.newaxis]
 
-            for interp in range(0, steps):
-                amount = float(interp) / float(steps)
-                i = ColorUtils._circular_interp(start, end, amount)
-                gradient.append(Color.NewFromRgb(*hsluv_to_rgb([i[0], i[1], i[2]]), i[3]))
+        # one row per segment between two stops
+        gradient = ColorUtils._circular_interp(luv_colors[:-1, np.newaxis],
+                                               luv_colors[1:, np.newaxis], amount)
 
-        return gradient
+        return _frozen(hsluv_to_rgb(gradient.reshape(-1, 4)))
 
 
     @staticmethod
@@ -307,7 +476,7 @@ class ColorUtils(object):
         optionally randomizing, or moving across the gradient in alternating
         directions.
 
-        :param gradient: a list of colors
+        :param gradient: a list or array of colors
         :param randomize: true if colors should be chosen randomly instead of
                           sequentially
         :param alternate: true if two iterators should move sequentially
@@ -315,7 +484,10 @@ class ColorUtils(object):
         :param rgb: true if RGB int tuples should be returned
         :return: generator
         """
-        grad = gradient[:]
+        if isinstance(gradient, np.ndarray):
+            grad = to_colors(gradient)
+        else:
+            grad = gradient[:]
 
         if not randomize:
             grad.extend(grad[::-1])
@@ -343,19 +515,29 @@ class ColorUtils(object):
 
     @staticmethod
     @colorarg
-    def color_scheme(color: ColorType=None, base_color: ColorType=None, steps: int=11):
+    def color_scheme(color: ColorType=None, base_color: ColorType=None,
+                     steps: int=11) -> 'ColorArray':
         """
-        Generator which produces a continuous stream of colors based on a
-        color scheme of two overlapping colors.
+        Generate a gradient based on a color scheme of two
+        overlapping colors.
+
+        The result is cached and must not be modified.
 
         :param color: The "top" color
         :param base_color: The base or bg_color color
-        :param randomize: True if values should be chosen at random instead of sequential
         :param steps: Number of steps used for the gradient
-        :param rgb: True if we should return RGB tuples
 
-        :return: generator
+        :return: ColorArray of the colors in the gradient
         """
+        return ColorUtils._color_scheme(_color_key(color), _color_key(base_color), steps)
+
+
+    @staticmethod
+    @lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+    def _color_scheme(color: tuple, base_color: tuple, steps: int) -> 'ColorArray':
+        color = to_color(color)
+        base_color = to_color(base_color)
+
         c0 = c1 = None
         if base_color is not None and color is not None:
             c0, c1 = color.AnalogousScheme(angle=15)
@@ -387,28 +569,25 @@ class ColorUtils(object):
 
 
     @staticmethod
+    @lru_cache(maxsize=GRADIENT_CACHE_SIZE)
     def interference(length, freq1: float=0.3, freq2: float=0.3, freq3: float=0.3,
                      phase1: float=0.0, phase2: float=2.0, phase3: float=4.0,
-                     center: float=128.0, width: float=127.0):
+                     center: float=128.0, width: float=127.0) -> 'ColorArray':
         """
         Creates an interference pattern of three sine waves
-        """
-        phase1 = phase1 * math.pi / 3
-        phase2 = phase2 * math.pi / 3
-        phase3 = phase3 * math.pi / 3
 
-        center /= 255.0
-        width /= 255.0
+        The result is cached and must not be modified.
 
-        gradient = []
+        :return: ColorArray of the colors
+        """
+        steps = np.arange(length)
+        gradient = np.ones((length, 4), dtype=np.float64)
 
-        for i in range(0, length):
-            r = math.sin(freq1 * i + phase1) * width + center
-            g = math.sin(freq2 * i + phase2) * width + center
-            b = math.sin(freq3 * i + phase3) * width + center
-            gradient.append(Color.NewFromRgb(r, g, b))
+        for chan, freq, phase in ((0, freq1, phase1), (1, freq2, phase2), (2, freq3, phase3)):
+            gradient[:, chan] = np.sin(freq * steps + (phase * math.pi / 3)) \
+                    * (width / 255.0) + (center / 255.0)
 
-        return gradient
+        return _frozen(gradient)
 
 
     @staticmethod
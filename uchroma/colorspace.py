@@ -0,0 +1,227 @@
+#
+# uchroma - Copyright (C) 2017 Steve Kondik
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+
+# pylint: disable=invalid-name
+
+"""
+Vectorized color space conversions
+
+All conversions operate on arrays of shape (..., 3) or (..., 4) where
+the last axis holds the channels, so a whole gradient or layer can be
+converted at once. An alpha channel is passed through untouched.
+
+RGB channels are in [0, 1] and hue is in degrees [0, 360). Saturation,
+value and lightness are in [0, 1] for HSV and HSL, like grapefruit, and
+in [0, 100] for HSLuv, like the hsluv package.
+"""
+
+import numpy as np
+
+
+# XYZ to sRGB and back, same constants as the hsluv package
+_M = np.array([[3.240969941904521, -1.537383177570093, -0.498610760293],
+               [-0.96924363628087, 1.87596750150772, 0.041555057407175],
+               [0.055630079696993, -0.20397695888897, 1.056971514242878]])
+
+_M_INV = np.array([[0.41239079926595, 0.35758433938387, 0.18048078840183],
+                   [0.21263900587151, 0.71516867876775, 0.072192315360733],
+                   [0.019330818715591, 0.11919477979462, 0.95053215224966]])
+
+_REF_U = 0.19783000664283
+_REF_V = 0.46831999493879
+_KAPPA = 903.2962962
+_EPSILON = 0.0088564516
+
+
+def _split(arr) -> tuple:
+    arr = np.asarray(arr, dtype=np.float64)
+    if arr.ndim == 0 or arr.shape[-1] not in (3, 4):
+        raise ValueError('Colors must be RGB or RGBA, got shape %s' % (arr.shape,))
+    return arr[..., 0], arr[..., 1], arr[..., 2], arr[..., 3:]
+
+
+def _join(c0, c1, c2, alpha) -> np.ndarray:
+    return np.concatenate((np.stack((c0, c1, c2), axis=-1), alpha), axis=-1)
+
+
+def _hue(r, g, b, cmax, delta) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hue = np.where(cmax == r, ((g - b) / delta) % 6.0,
+                       np.where(cmax == g, (b - r) / delta + 2.0,
+                                (r - g) / delta + 4.0))
+    return np.where(delta == 0, 0.0, hue * 60.0)
+
+
+def rgb_to_hsv(arr) -> np.ndarray:
+    """
+    Convert RGB colors to HSV
+
+    :param arr: Array of RGB(A) colors
+    :return: Array of HSV(A) colors
+    """
+    r, g, b, alpha = _split(arr)
+    cmax = np.maximum(np.maximum(r, g), b)
+    delta = cmax - np.minimum(np.minimum(r, g), b)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sat = np.where(cmax == 0, 0.0, delta / cmax)
+
+    return _join(_hue(r, g, b, cmax, delta), sat, cmax, alpha)
+
+
+def hsv_to_rgb(arr) -> np.ndarray:
+    """
+    Convert HSV colors to RGB
+
+    :param arr: Array of HSV(A) colors
+    :return: Array of RGB(A) colors
+    """
+    h, s, v, alpha = _split(arr)
+    h = (h % 360.0) / 60.0
+
+    def channel(n):
+        k = (n + h) % 6.0
+        return v - v * s * np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+
+    return _join(channel(5.0), channel(3.0), channel(1.0), alpha)
+
+
+def rgb_to_hsl(arr) -> np.ndarray:
+    """
+    Convert RGB colors to HSL
+
+    :param arr: Array of RGB(A) colors
+    :return: Array of HSL(A) colors
+    """
+    r, g, b, alpha = _split(arr)
+    cmax = np.maximum(np.maximum(r, g), b)
+    cmin = np.minimum(np.minimum(r, g), b)
+    delta = cmax - cmin
+    light = (cmax + cmin) / 2.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sat = np.where(delta == 0, 0.0, delta / (1.0 - np.abs(2.0 * light - 1.0)))
+
+    return _join(_hue(r, g, b, cmax, delta), sat, light, alpha)
+
+
+def hsl_to_rgb(arr) -> np.ndarray:
+    """
+    Convert HSL colors to RGB
+
+    :param arr: Array of HSL(A) colors
+    :return: Array of RGB(A) colors
+    """
+    h, s, l, alpha = _split(arr)
+    h = (h % 360.0) / 30.0
+    a = s * np.minimum(l, 1.0 - l)
+
+    def channel(n):
+        k = (n + h) % 12.0
+        return l - a * np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)
+
+    return _join(channel(0.0), channel(8.0), channel(4.0), alpha)
+
+
+def _max_chroma(l, h) -> np.ndarray:
+    """
+    Largest chroma which stays inside sRGB for each lightness and hue
+    """
+    hrad = np.radians(h)
+    sin_h = np.sin(hrad)
+    cos_h = np.cos(hrad)
+
+    sub1 = ((l + 16.0) ** 3) / 1560896.0
+    sub2 = np.where(sub1 > _EPSILON, sub1, l / _KAPPA)
+
+    result = np.full(np.shape(l), np.inf)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for m1, m2, m3 in _M:
+            for t in (0.0, 1.0):
+                top1 = (284517.0 * m1 - 94839.0 * m3) * sub2
+                top2 = (838422.0 * m3 + 769860.0 * m2 + 731718.0 * m1) \
+                        * l * sub2 - (769860.0 * t) * l
+                bottom = (632260.0 * m3 - 126452.0 * m2) * sub2 + 126452.0 * t
+
+                length = (top2 / bottom) / (sin_h - (top1 / bottom) * cos_h)
+                result = np.where(length >= 0, np.minimum(result, length), result)
+
+    return result
+
+
+def rgb_to_hsluv(arr) -> np.ndarray:
+    """
+    Convert RGB colors to HSLuv
+
+    :param arr: Array of RGB(A) colors
+    :return: Array of HSLuv(A) colors
+    """
+    r, g, b, alpha = _split(arr)
+    rgb = np.stack((r, g, b), axis=-1)
+
+    linear = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    x, y, z = np.moveaxis(linear @ _M_INV.T, -1, 0)
+
+    l = np.where(y <= _EPSILON, y * _KAPPA, 116.0 * np.cbrt(y) - 16.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        divider = x + 15.0 * y + 3.0 * z
+        u = np.where(l == 0, 0.0, 13.0 * l * ((4.0 * x / divider) - _REF_U))
+        v = np.where(l == 0, 0.0, 13.0 * l * ((9.0 * y / divider) - _REF_V))
+
+    chroma = np.hypot(u, v)
+    hue = np.where(chroma < 1e-8, 0.0, np.degrees(np.arctan2(v, u)) % 360.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sat = chroma / _max_chroma(l, hue) * 100.0
+
+    sat = np.where((l > 100.0 - 1e-7) | (l < 1e-8), 0.0, sat)
+    l = np.where(l > 100.0 - 1e-7, 100.0, np.where(l < 1e-8, 0.0, l))
+
+    return _join(hue, sat, l, alpha)
+
+
+def hsluv_to_rgb(arr) -> np.ndarray:
+    """
+    Convert HSLuv colors to RGB
+
+    Colors are not clipped, so values may fall slightly outside
+    of [0, 1] due to rounding.
+
+    :param arr: Array of HSLuv(A) colors
+    :return: Array of RGB(A) colors
+    """
+    h, s, l, alpha = _split(arr)
+
+    with np.errstate(invalid='ignore'):
+        chroma = np.where((l > 100.0 - 1e-7) | (l < 1e-8), 0.0, _max_chroma(l, h) / 100.0 * s)
+    l = np.where(l > 100.0 - 1e-7, 100.0, l)
+
+    hrad = np.radians(h)
+    u = np.cos(hrad) * chroma
+    v = np.sin(hrad) * chroma
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var_u = u / (13.0 * l) + _REF_U
+        var_v = v / (13.0 * l) + _REF_V
+        y = np.where(l <= 8.0, l / _KAPPA, ((l + 16.0) / 116.0) ** 3)
+        x = y * 9.0 * var_u / (4.0 * var_v)
+        z = y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+
+    xyz = np.where((l == 0)[..., np.newaxis], 0.0, np.stack((x, y, z), axis=-1))
+    linear = xyz @ _M.T
+
+    rgb = np.where(linear <= 0.0031308, 12.92 * linear,
+                   1.055 * np.maximum(linear, 0.0031308) ** (5.0 / 12.0) - 0.055)
+
+    return _join(rgb[..., 0], rgb[..., 1], rgb[..., 2], alpha)
@@ -26,6 +26,7 @@ from grapefruit import Color
 
 import numpy as np
 
+from uchroma.color import ColorArray
 from uchroma.log import Log
 from uchroma.traits import class_traits_as_dict, ColorTrait, \
         ColorSchemeTrait, trait_as_dict
@@ -72,9 +73,10 @@ def dbus_prepare(obj, variant: bool=False, camel_keys: bool=False) -> tuple:
             sig = 's'
 
         elif isinstance(obj, int):
-            if obj < pow(2, 16):
+            # signed ranges, so large counters don't overflow
+            if -pow(2, 15) <= obj < pow(2, 15):
                 sig = 'n'
-            elif obj < pow(2, 32):
+            elif -pow(2, 31) <= obj < pow(2, 31):
                 sig = 'i'
             else:
                 sig = 'x'
@@ -105,6 +107,10 @@ def dbus_prepare(obj, variant: bool=False, camel_keys: bool=False) -> tuple:
             obj = obj.name
             sig = 's'
 
+        elif isinstance(obj, ColorArray):
+            sig = 'as'
+            obj = obj.to_html()
+
         elif isinstance(obj, np.ndarray):
             dtype = obj.dtype.kind
             if dtype == 'f':
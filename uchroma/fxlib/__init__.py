@@ -11,6 +11,7 @@
 # License for more details.
 #
 from .plasma import Plasma
+from .playback import Playback
 from .rainbow import Rainbow
 from .ripple import Ripple
 from .reaction import Reaction
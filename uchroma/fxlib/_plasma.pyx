@@ -1,26 +1,49 @@
 
 # pylint: disable=invalid-name
 
-from libc.math cimport cos, sin, sqrt
-from math import pi
+# cython: boundscheck=False, wraparound=False
+
+from libc.math cimport cos, sin, sqrt, M_PI
 
 import numpy as np
 cimport numpy as np
 
-def draw_plasma(double width, double height, np.ndarray matrix, double duration, gradient):
-    cdef int row, col
+def draw_plasma(int width, int height, double[:, :, ::1] matrix, double duration,
+                const double[:, ::1] gradient):
+    """
+    Draw the plasma field into matrix
+
+    :param width: Width of the matrix
+    :param height: Height of the matrix
+    :param matrix: The layer matrix (height, width, 4)
+    :param duration: Time since the effect started, in seconds
+    :param gradient: Array of RGBA colors (N, 4)
+    """
+    cdef int row, col, idx, chan
     cdef double x, y, val, cx, cy, pos
-    cdef double glen = float(len(gradient))
+    cdef int glen = gradient.shape[0]
+
+    # terms which only depend on time
+    cdef double sin2 = sin(duration / 2.0)
+    cdef double cos3 = cos(duration / 3.0)
+    cdef double sin5 = sin(duration / 5.0)
 
-    for col in range(0, int(width)):
-        for row in range(0, int(height)):
-            y = float(row) / (height * (width / height))
-            x = float(col) / width
+    for col in range(0, width):
+        x = <double>col / width
+        cx = x * sin5
 
-            val = sin(2.0 * (x * sin(duration / 2.0) + y * cos(duration / 3.0)) + duration)
-            cx = x * sin(duration / 5.0)
-            cy = y * cos(duration / 3.0)
+        for row in range(0, height):
+            y = <double>row / width
+
+            val = sin(2.0 * (x * sin2 + y * cos3) + duration)
+            cy = y * cos3
             val += sin(sqrt(20.0 * (cx * cx + cy * cy) + 1.0) + duration)
 
-            pos = glen * ((1.0 + sin(pi * val)) / 2.0)
-            matrix[row][col] = tuple(gradient[int(pos) - 1])
+            pos = glen * ((1.0 + sin(M_PI * val)) / 2.0)
+
+            idx = <int>pos - 1
+            if idx < 0:
+                idx += glen
+
+            for chan in range(0, 4):
+                matrix[row, col, chan] = gradient[idx, chan]
@@ -16,6 +16,8 @@
 import asyncio
 import time
 
+import numpy as np
+
 from traitlets import observe, Int
 
 from uchroma.color import ColorScheme, ColorUtils
@@ -50,8 +52,14 @@ class Plasma(Renderer):
         self.fps = 15
 
 
+    @staticmethod
+    def _make_gradient(length, colors):
+        return np.ascontiguousarray(ColorUtils.gradient(length, *colors), dtype=np.float64)
+
+
     def _gen_gradient(self):
-        self._gradient = ColorUtils.gradient(self.gradient_length, *self.color_scheme)
+        self._rebuild('_gradient', Plasma._make_gradient,
+                      self.gradient_length, tuple(self.color_scheme))
 
 
     @observe('color_scheme', 'gradient_length', 'preset')
@@ -66,7 +74,9 @@ class Plasma(Renderer):
 
     def init(self, frame):
         self._start_time = time.time()
-        self._gen_gradient()
+        # a reused instance keeps its gradient
+        if self._gradient is None:
+            self._gen_gradient()
         return True
 
 
@@ -0,0 +1,174 @@
+#
+# uchroma - Copyright (C) 2017 Steve Kondik
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+
+# pylint: disable=invalid-name
+
+import io
+import os
+import struct
+import zipfile
+
+import numpy as np
+
+from traitlets import Bool, Unicode
+
+from uchroma.renderer import Renderer, RendererMeta
+
+
+SUPPORTED_DTYPES = (np.uint8, np.float32)
+
+# members of an animation file
+FRAMES_MEMBER = 'frames.npy'
+FPS_MEMBER = 'fps.npy'
+
+# size of a zip local file header, without the name and extra field
+_ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def save_animation(path: str, frames_path: str, fps: float):
+    """
+    Store baked frames and their frame rate as an animation file
+
+    The file is an uncompressed .npz archive, so the frames can
+    be memory-mapped directly from it.
+
+    :param path: Path of the animation file to create
+    :param frames_path: Path of a .npy file holding the frames
+    :param fps: Frame rate the frames were drawn at
+    """
+    buf = io.BytesIO()
+    np.lib.format.write_array(buf, np.array(fps, dtype=np.float64))
+
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED,
+                         allowZip64=True) as archive:
+        archive.write(frames_path, FRAMES_MEMBER)
+        archive.writestr(FPS_MEMBER, buf.getvalue())
+
+
+def load_animation(path: str) -> tuple:
+    """
+    Memory-map the frames of an animation file
+
+    Plain .npy files without a frame rate are also accepted.
+
+    :param path: Path of the .npz or .npy file
+    :return: Tuple of the frames and the frame rate, which is None if
+             the file doesn't store one
+    """
+    if not zipfile.is_zipfile(path):
+        return np.load(path, mmap_mode='r', allow_pickle=False), None
+
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(FRAMES_MEMBER)
+        if info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError('Frames must be stored uncompressed')
+
+        with archive.open(FPS_MEMBER) as fps_file:
+            fps = float(np.lib.format.read_array(fps_file, allow_pickle=False))
+
+    # locate the .npy data of the frames inside the archive
+    with open(path, 'rb') as data:
+        data.seek(info.header_offset)
+        header = _ZIP_LOCAL_HEADER.unpack(data.read(_ZIP_LOCAL_HEADER.size))
+        data.seek(header[-2] + header[-1], os.SEEK_CUR)
+
+        version = np.lib.format.read_magic(data)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(data)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(data)
+        offset = data.tell()
+
+    frames = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape,
+                       order='F' if fortran_order else 'C')
+    return frames, fps
+
+
+class Playback(Renderer):
+    """
+    Plays back a pre-baked animation
+
+    The animation is a file created by the uchroma-bake tool,
+    containing an array of shape (frames, height, width, 4) in either
+    uint8 or float32 RGBA and the frame rate it was baked at. Plain
+    .npy arrays are also supported, and play at the fps trait. The
+    frames are memory-mapped, so drawing a frame is only a slice and
+    a copy into the layer.
+    """
+
+    # meta
+    meta = RendererMeta('Playback', 'Play back a pre-baked animation',
+                        'Steve Kondik', '1.0')
+
+    # configurable traits
+    path = Unicode(default_value='').tag(config=True)
+    loop = Bool(default_value=True).tag(config=True)
+
+
+    def __init__(self, *args, **kwargs):
+        super(Playback, self).__init__(*args, **kwargs)
+
+        self._frames = None
+        self._index = 0
+
+
+    def _load(self) -> bool:
+        path = os.path.expanduser(self.path)
+        if not os.path.isfile(path):
+            self.logger.error("Animation file not found: %s", path)
+            return False
+
+        try:
+            frames, fps = load_animation(path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as err:
+            self.logger.exception("Unable to load animation: %s", path, exc_info=err)
+            return False
+
+        if frames.ndim != 4 or frames.shape[1:] != (self.height, self.width, 4):
+            self.logger.error("Animation shape %s does not match device (%d, %d, 4)",
+                              frames.shape, self.height, self.width)
+            return False
+
+        if frames.dtype not in SUPPORTED_DTYPES:
+            self.logger.error("Unsupported animation dtype: %s", frames.dtype)
+            return False
+
+        # play at the speed it was baked at
+        if fps is not None:
+            self.fps = fps
+
+        self._frames = frames
+        self._index = 0
+
+        self.logger.info("Loaded %d frames from %s", frames.shape[0], path)
+        return True
+
+
+    def init(self, frame) -> bool:
+        return self._load()
+
+
+    def finish(self, frame):
+        self._frames = None
+
+
+    async def draw(self, layer, timestamp):
+        layer.put_array(self._frames[self._index])
+
+        # hold the last frame when not looping
+        if self._index < self._frames.shape[0] - 1:
+            self._index += 1
+        elif self.loop:
+            self._index = 0
+
+        return True
@@ -12,9 +12,11 @@
 #
 import asyncio
 
+import numpy as np
+
 from traitlets import Int, observe
-from grapefruit import Color
 
+from uchroma.color import ColorUtils
 from uchroma.renderer import Renderer, RendererMeta
 
 
@@ -35,38 +37,47 @@ class Rainbow(Renderer):
         super(Rainbow, self).__init__(*args, **kwargs)
 
         self._gradient = None
+        self._index = None
         self._offset = 0
 
         self.fps = 5
 
 
     @staticmethod
-    def _hue_gradient(start, length):
-        step = 360 / length
-        return [Color.NewFromHsv((start + (step * x)) % 360, 1, 1) for x in range(0, length)]
+    def _make_gradient(width, height, speed, stagger):
+        gradient = ColorUtils.hue_gradient(0, speed * width + (height * stagger))
+
+        # position of each pixel in the gradient, before the offset
+        rows, cols = np.indices((height, width))
+        index = (rows * stagger) + cols
+
+        return gradient.astype(np.float64), index, 0
 
 
     @observe('speed', 'stagger')
     def _create_gradient(self, change=None):
-        self._offset = 0
-        self._gradient = Rainbow._hue_gradient( \
-            0, self.speed * self.width + (self.height * self.stagger))
+        # the offset starts over along with the new gradient
+        self._rebuild(('_gradient', '_index', '_offset'), Rainbow._make_gradient,
+                      self.width, self.height, self.speed, self.stagger)
 
 
     def init(self, frame):
-        self._create_gradient()
+        # a reused instance keeps its gradient and recorded cycle
+        if self._gradient is None:
+            self._create_gradient()
         return True
 
 
+    @property
+    def period(self):
+        if self._gradient is None:
+            return None
+        return len(self._gradient)
+
+
     async def draw(self, layer, timestamp):
-        data = []
-        for row in range(0, layer.height):
-            data.append( \
-                [self._gradient[ \
-                (self._offset + (row * self.stagger) + col) % len(self._gradient)] \
-                for col in range(0, layer.width)])
-
-        layer.put_all(data)
+        np.take(self._gradient, self._index + self._offset, axis=0,
+                out=layer.matrix, mode='wrap')
         self._offset = (self._offset + 1) % len(self._gradient)
 
         return True
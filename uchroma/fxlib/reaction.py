@@ -13,6 +13,8 @@
 
 # pylint: disable=invalid-name
 
+import numpy as np
+
 from traitlets import Int, observe
 
 from uchroma.color import ColorUtils
@@ -24,7 +26,7 @@ DEFAULT_SPEED = 6
 MAX_SPEED = 9
 EXPIRE_TIME_FACTOR = 0.25
 
-REACT_COLOR_KEY = 'reaction_color'
+REACT_INDEX_KEY = 'reaction_index'
 
 
 class Reaction(Renderer):
@@ -48,6 +50,7 @@ class Reaction(Renderer):
     def __init__(self, *args, **kwargs):
         super(Reaction, self).__init__(*args, **kwargs)
         self.fps = 30
+        self._geometry = None
 
         # It seems like observers can be called before __init__
         # How is this possible?
@@ -74,38 +77,64 @@ class Reaction(Renderer):
             color=color, base_color=bg_color, steps=100)
         self._gradient_count = len(self._gradient)
 
+        # table of the gradient plus the background color at the end
+        background = (0.0, 0.0, 0.0, 0.0)
+        if self.background_color is not None:
+            background = tuple(self.background_color)
+        self._colors = np.vstack((self._gradient, background))
+
+    def _key_index(self, event):
+        """
+        flat indices into the layer of all coordinates of an event
+        """
+        if REACT_INDEX_KEY not in event.data:
+            index = self._geometry.key_index(event.keycode)
+            if index is None:
+                index = self._geometry.points_index(event.coords)
+            event.data[REACT_INDEX_KEY] = index
+
+        return event.data[REACT_INDEX_KEY]
+
     def _process_events(self, layer, events):
         """
-        process events and assign a color to each one
+        process events and assign a color to each key
         """
         if self._gradient is None:
             return None
 
+        active = []
         for event in events:
-            if REACT_COLOR_KEY not in events:
-                # percent_complete appears to go from 1 to 0.
-                # perhaps it should be renamed percent_remaining?
-                idx = int(self._gradient_count - (event.percent_complete*self._gradient_count))
-                if event.percent_complete <= 0.15:
-                    # TODO: Is there a better way to know if this will be
-                    # the last event for this key press?
-                    event.data[REACT_COLOR_KEY] = self.background_color
-                else:
-                    event.data[REACT_COLOR_KEY] = self._gradient[idx]
-
-            self._react_keys(layer, event)
-
-    def _react_keys(self, layer, event):
-        """
-        updates all the coordinates for an event with the appropriate color
-        """
-        if event.coords is None or len(event.coords) == 0:
-            self.logger.error('No coordinates available: %s', event)
-            return
+            if event.coords is None or len(event.coords) == 0:
+                self.logger.error('No coordinates available: %s', event)
+                continue
+            active.append(event)
+
+        events = active
+        if len(events) == 0:
+            return None
+
+        # percent_complete appears to go from 1 to 0.
+        # perhaps it should be renamed percent_remaining?
+        percent = np.array([event.percent_complete for event in events])
+        idx = (self._gradient_count - (percent * self._gradient_count)).astype(np.intp)
+
+        # TODO: Is there a better way to know if this will be
+        # the last event for this key press?
+        idx[percent <= 0.15] = self._gradient_count
+
+        keys = [self._key_index(event) for event in events]
+        counts = [len(key) for key in keys]
+
+        pixels = np.concatenate(keys)
+        colors = np.repeat(idx, counts)
+
+        # later events win where keys overlap. numpy doesn't define which
+        # duplicate index of an assignment wins, so keep only the last one
+        _, last = np.unique(pixels[::-1], return_index=True)
+        last = len(pixels) - 1 - last
 
-        react_color = event.data[REACT_COLOR_KEY]
-        for coord in event.coords:
-            layer.put(coord.y, coord.x, react_color)
+        rows, cols = np.unravel_index(pixels[last], layer.matrix.shape[:2])
+        layer.matrix[rows, cols] = self._colors[colors[last]]
 
     async def draw(self, layer, timestamp):
         """
@@ -137,4 +166,5 @@ class Reaction(Renderer):
     def init(self, frame) -> bool:
         if not self.has_key_input:
             return False
+        self._geometry = frame.geometry
         return True
@@ -17,6 +17,8 @@ import asyncio
 import math
 import operator
 
+import numpy as np
+
 from traitlets import Bool, Int, observe
 
 from uchroma.color import ColorScheme, ColorUtils
@@ -32,6 +34,10 @@ EXPIRE_TIME_FACTOR = 0.15
 
 COLOR_KEY = 'ripple_color'
 SCHEME_KEY = 'color_scheme'
+RINGS_KEY = 'ripple_rings'
+
+# rows are further apart than columns on most keyboards
+ROW_SCALE = 1.33
 
 
 class Ripple(Renderer):
@@ -54,6 +60,7 @@ class Ripple(Renderer):
 
         self._generator = ColorUtils.rainbow_generator()
         self._max_distance = None
+        self._geometry = None
         self.key_expire_time = DEFAULT_SPEED * EXPIRE_TIME_FACTOR
 
         self.fps = 30
@@ -84,6 +91,23 @@ class Ripple(Renderer):
         return 0.5 * (n**5 + 2)
 
 
+    def _get_rings(self, event):
+        """
+        Ring number of every pixel relative to the key of the event
+        """
+        if RINGS_KEY not in event.data:
+            field = self._geometry.key_distance(event.keycode, ROW_SCALE)
+            if field is None:
+                field = self._geometry.points_distance(event.coords, ROW_SCALE)
+
+            rings = None
+            if field is not None:
+                rings = np.rint(field).astype(np.int16)
+            event.data[RINGS_KEY] = rings
+
+        return event.data[RINGS_KEY]
+
+
     def _draw_circles(self, layer, radius, event):
         width = self.ripple_width
         if COLOR_KEY not in event.data:
@@ -100,19 +124,27 @@ class Ripple(Renderer):
             if width > 1:
                 colors = ColorUtils.color_scheme(color=color, base_color=color, steps=width)
             else:
-                colors = [color]
+                colors = np.array([tuple(color)], dtype=np.float64)
             event.data[SCHEME_KEY] = colors
 
-        for circle_num in range(width - 1, -1, -1):
-            if radius - circle_num < 0:
-                continue
+        rings = self._get_rings(event)
+        if rings is None:
+            return
+
+        # circle number of each pixel, counting inwards from the outermost
+        circles = math.floor(radius) - rings
+        mask = (circles >= 0) & (circles < width)
+        if not mask.any():
+            return
 
+        table = np.empty((width, 4), dtype=np.float64)
+        for circle_num in range(0, width):
             rad = radius - circle_num
             a = Ripple._ease(1.0 - (rad / self._max_distance))
-            cc = (*colors[circle_num].rgb, colors[circle_num].alpha * a)
+            table[circle_num] = colors[circle_num]
+            table[circle_num, 3] *= a
 
-            for coord in event.coords:
-                layer.ellipse(coord.y, coord.x, rad / 1.33, rad, color=cc)
+        layer.composite(*np.nonzero(mask), table[circles[mask]])
 
 
     async def draw(self, layer, timestamp):
@@ -170,6 +202,7 @@ class Ripple(Renderer):
         if not self.has_key_input:
             return False
 
-        self._max_distance = math.hypot(frame.width, frame.height)
+        self._geometry = frame.geometry
+        self._max_distance = self._geometry.diagonal
 
         return True
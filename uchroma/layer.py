@@ -14,6 +14,8 @@
 # pylint: disable=invalid-name, too-many-arguments
 
 import math
+import numbers
+from functools import lru_cache
 
 import numpy as np
 from grapefruit import Color
@@ -27,6 +29,60 @@ from uchroma.util import clamp
 from uchroma._layer import color_to_np, set_color
 
 
+# names of all blending functions, resolved once
+BLEND_MODES = frozenset(BlendOp.get_modes())
+
+# number of distinct primitive shapes to remember
+PRIMITIVE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PRIMITIVE_CACHE_SIZE)
+def _primitive(shape: str, radii: tuple, aa: bool) -> tuple:
+    """
+    Compute the pixels of a drawing primitive relative to the origin
+
+    The result only depends on the size of the shape, so it is
+    memoized and translated to wherever the shape is drawn.
+
+    :param shape: One of 'circle', 'disk', 'ellipse', 'filled_ellipse' or 'line'
+    :param radii: Radius (circle, disk), radii (ellipses) or end point (line)
+    :param aa: True for the antialiased variant of circles and lines
+
+    :return: Read-only arrays of (rows, cols, alpha), alpha is None
+             unless the primitive is antialiased
+    """
+    alpha = None
+    if shape == 'circle':
+        if aa:
+            rr, cc, alpha = draw.circle_perimeter_aa(0, 0, radii[0])
+        else:
+            rr, cc = draw.circle_perimeter(0, 0, radii[0])
+
+    elif shape == 'disk':
+        rr, cc = draw.circle(0, 0, radii[0])
+
+    elif shape == 'ellipse':
+        rr, cc = draw.ellipse_perimeter(0, 0, radii[0], radii[1])
+
+    elif shape == 'filled_ellipse':
+        rr, cc = draw.ellipse(0, 0, radii[0], radii[1])
+
+    elif shape == 'line':
+        if aa:
+            rr, cc, alpha = draw.line_aa(0, 0, radii[0], radii[1])
+        else:
+            rr, cc = draw.line(0, 0, radii[0], radii[1])
+
+    else:
+        raise ValueError('Unknown primitive: %s' % shape)
+
+    for arr in (rr, cc, alpha):
+        if arr is not None:
+            arr.flags.writeable = False
+
+    return rr, cc, alpha
+
+
 class Layer(object):
     """
     Provides utilities and constructs for drawing a single layer of a
@@ -48,6 +104,18 @@ class Layer(object):
         self._blend_mode = BlendOp.screen
         self._opacity = 1.0
 
+        # scratch mask for set_color, which leaves it cleared
+        self._seen = np.zeros(shape=(self._height, self._width), dtype=np.uint8)
+
+
+    @property
+    def blend_op(self):
+        """
+        The blending function for this layer, as a reference
+        to the function in uchroma.blending.BlendOp
+        """
+        return self._blend_mode
+
 
     @property
     def blend_mode(self) -> str:
@@ -70,7 +138,7 @@ class Layer(object):
             self._blend_mode = BlendOp.screen
 
         elif isinstance(mode, str):
-            if mode in BlendOp.get_modes():
+            if mode in BLEND_MODES:
                 self._blend_mode = getattr(BlendOp, mode)
 
 
@@ -184,7 +252,7 @@ class Layer(object):
         """
         set_color(
             self.matrix, (np.array([row,] * len(color)), np.arange(col, col + len(color))),
-            color_to_np(*color))
+            color_to_np(*color), seen=self._seen)
 
         return self
 
@@ -193,18 +261,175 @@ class Layer(object):
         """
         Set the color of all pixels
 
-        :param data: List of lists (row * col) of colors
+        :param data: List of lists (row * col) of colors, or an array
+                     which is handed to put_array
         """
+        if isinstance(data, np.ndarray):
+            return self.put_array(data)
+
         for row in range(0, len(data)):
             self.put(row, 0, *data[row])
 
         return self
 
 
+    @staticmethod
+    def _as_rgba(value) -> np.ndarray:
+        """
+        Convert a color or array of colors to RGBA floats without
+        any per-pixel work. Arrays of RGB colors get an opaque alpha
+        channel and uint8 arrays are scaled to [0, 1].
+        """
+        if not isinstance(value, np.ndarray):
+            return np.array(tuple(to_color(value)), dtype=np.float)
+
+        if value.dtype == np.uint8:
+            value = value * (1.0 / 255.0)
+
+        if value.shape[-1] == 3:
+            alpha = np.ones(value.shape[:-1] + (1,), dtype=np.float)
+            value = np.concatenate((value, alpha), axis=-1)
+
+        elif value.shape[-1] != 4:
+            raise ValueError('Color arrays must be RGB or RGBA, got shape %s' % (value.shape,))
+
+        return value
+
+
+    def put_array(self, data: np.ndarray, row: int=0, col: int=0) -> 'Layer':
+        """
+        Copy an array of colors into this layer
+
+        This is the fast path for renderers which already have their
+        output as an array: the data is copied as-is, without blending
+        or conversion to Color objects. Data which extends past the
+        edges of the layer is cropped.
+
+        :param data: Array of shape (height, width, 3|4), or (width, 3|4)
+                     for a single row. May be float [0, 1] or uint8.
+        :param row: Row to place the top edge of the data at
+        :param col: Column to place the left edge of the data at
+
+        :return: This layer instance
+        """
+        data = np.asarray(data)
+        if data.ndim == 2:
+            data = data[np.newaxis, ...]
+
+        if data.ndim != 3 or data.shape[-1] not in (3, 4):
+            raise ValueError('Color arrays must be RGB or RGBA, got shape %s' % (data.shape,))
+
+        height = min(data.shape[0], self.height - row)
+        width = min(data.shape[1], self.width - col)
+        if height <= 0 or width <= 0:
+            return self
+
+        data = data[:height, :width]
+        dest = self._matrix[row:row + height, col:col + width]
+        channels = data.shape[-1]
+
+        if data.dtype == np.uint8:
+            np.multiply(data, 1.0 / 255.0, out=dest[..., :channels])
+        else:
+            np.copyto(dest[..., :channels], data)
+
+        if channels == 3:
+            dest[..., 3] = 1.0
+
+        return self
+
+
+    def get_array(self, copy: bool=True) -> np.ndarray:
+        """
+        Get the contents of this layer as an array of RGBA floats
+
+        :param copy: Return a copy (default), otherwise a view of the
+                     matrix backing this layer
+
+        :return: Array of shape (height, width, 4)
+        """
+        if copy:
+            return self._matrix.copy()
+        return self._matrix
+
+
+    def fill(self, color: ColorType, mask: np.ndarray=None) -> 'Layer':
+        """
+        Fill the layer with a single color, optionally only where
+        a mask is set. Existing content is overwritten, not blended.
+
+        :param color: Color to fill with, or an array of colors
+                      matching the selected pixels
+        :param mask: Boolean array of shape (height, width)
+
+        :return: This layer instance
+        """
+        if mask is None:
+            self._matrix[...] = Layer._as_rgba(color)
+        else:
+            self._matrix[mask] = Layer._as_rgba(color)
+
+        return self
+
+
+    def composite(self, rows: np.ndarray, cols: np.ndarray, colors: np.ndarray,
+                  alpha=1.0) -> 'Layer':
+        """
+        Blend colors over the existing content at the given pixels
+
+        Empty pixels take the color as-is. If a pixel appears more than
+        once, the last sample is used. The inputs aren't copied when the
+        colors are float64 and the coordinates are intp arrays, so this
+        is suited to drawing on every frame.
+
+        :param rows: Row of each sample
+        :param cols: Column of each sample
+        :param colors: A single RGBA color, or one per sample
+        :param alpha: A single alpha value, or one per sample
+
+        :return: This layer instance
+        """
+        set_color(self._matrix, (rows, cols), colors, alpha, seen=self._seen)
+
+        return self
+
+
+    def __getitem__(self, key) -> np.ndarray:
+        return self._matrix[key]
+
+
+    def __setitem__(self, key, value):
+        """
+        Slice assignment of colors, e.g. layer[2, 3:10] = 'red'
+
+        A single color is broadcast over the selection, and arrays
+        are converted the same way as put_array. Plain numbers are
+        stored as-is, so single channels can be set directly.
+        """
+        if isinstance(value, numbers.Number):
+            self._matrix[key] = value
+        else:
+            self._matrix[key] = Layer._as_rgba(value)
+
+
     def _draw(self, rr, cc, color, alpha):
         if rr is None or rr.ndim == 0:
             return
-        set_color(self.matrix, (rr, cc), color_to_np(color), alpha)
+        set_color(self.matrix, (rr, cc), color_to_np(color), alpha, seen=self._seen)
+
+
+    def _draw_primitive(self, shape: str, radii: tuple, aa: bool,
+                        row: int, col: int, color, alpha):
+        rr, cc, aa_alpha = _primitive(shape, radii, aa)
+
+        rr = rr + int(round(row))
+        cc = cc + int(round(col))
+        mask = (rr >= 0) & (rr < self.height) & (cc >= 0) & (cc < self.width)
+
+        if aa_alpha is not None:
+            alpha = aa_alpha[mask]
+
+        self._draw(rr[mask], cc[mask], color, alpha)
 
 
     @colorarg
@@ -223,12 +448,11 @@ class Layer(object):
         :return: This frame instance
         """
         if fill:
-            rr, cc = draw.circle(row, col, round(radius), shape=self.matrix.shape)
-            self._draw(rr, cc, color, alpha)
-
+            self._draw_primitive('disk', (int(round(radius)),), False,
+                                 row, col, color, alpha)
         else:
-            rr, cc, aa = draw.circle_perimeter_aa(row, col, round(radius), shape=self.matrix.shape)
-            self._draw(rr, cc, color, aa)
+            self._draw_primitive('circle', (int(round(radius)),), True,
+                                 row, col, color, alpha)
 
         return self
 
@@ -249,15 +473,11 @@ class Layer(object):
 
         :return: This frame instance
         """
+        radii = (math.floor(radius_r), math.floor(radius_c))
         if fill:
-            rr, cc = draw.ellipse(row, col, math.floor(radius_r), math.floor(radius_c),
-                                  shape=self.matrix.shape)
-            self._draw(rr, cc, color, alpha)
-
+            self._draw_primitive('filled_ellipse', radii, False, row, col, color, alpha)
         else:
-            rr, cc = draw.ellipse_perimeter(row, col, math.floor(radius_r), math.floor(radius_c),
-                                            shape=self.matrix.shape)
-            self._draw(rr, cc, color, alpha)
+            self._draw_primitive('ellipse', radii, False, row, col, color, alpha)
 
         return self
 
@@ -274,8 +494,12 @@ class Layer(object):
         :param col2: End column
         :param color: Color to draw with
         """
-        rr, cc, aa = draw.line_aa(clamp(0, self.height, row1), clamp(0, self.width, col1),
-                                  clamp(0, self.height, row2), clamp(0, self.width, col2))
-        self._draw(rr, cc, color, aa)
+        row1 = int(clamp(row1, 0, self.height - 1))
+        col1 = int(clamp(col1, 0, self.width - 1))
+        row2 = int(clamp(row2, 0, self.height - 1))
+        col2 = int(clamp(col2, 0, self.width - 1))
+
+        self._draw_primitive('line', (row2 - row1, col2 - col1), True,
+                             row1, col1, color, alpha)
 
         return self
@@ -14,24 +14,39 @@
 # pylint: disable=invalid-name, too-many-instance-attributes, too-many-function-args
 
 import asyncio
+import functools
+import time
 
 from abc import abstractmethod
+from collections import OrderedDict
+from concurrent import futures
 from typing import NamedTuple
 
-from traitlets import Bool, CaselessStrEnum, HasTraits, Float, Int, observe, Unicode
+import numpy as np
+
+from traitlets import All, Bool, CaselessStrEnum, HasTraits, Float, Int, observe, Unicode
 
 from uchroma.blending import BlendOp
 from uchroma.input_queue import InputQueue
 from uchroma.layer import Layer
 from uchroma.log import Log
 from uchroma.traits import ColorTrait, DefaultCaselessStrEnum, WriteOnceInt
-from uchroma.util import Ticker
+from uchroma.util import Histogram, Ticker
 
 
 MAX_FPS = 30
 DEFAULT_FPS = 15
 NUM_BUFFERS = 2
 
+# upper bound on memory used by the render-ahead cache
+MAX_CACHE_BYTES = 4 * 1024 * 1024
+
+# traits which don't affect the content of a drawn frame
+UNCACHED_TRAITS = ('fps', 'blend_mode', 'opacity', 'background_color')
+
+# shared by all renderers for rebuilding derived state
+_rebuild_executor = None
+
 
 RendererMeta = NamedTuple('RendererMeta', [('display_name', str), ('description', str),
                                            ('author', str), ('version', str)])
@@ -68,6 +83,20 @@ class Renderer(HasTraits, object):
         self.height = driver.height
 
         self._tick = Ticker(1 / DEFAULT_FPS)
+        self._fps_limit = None
+        self._draw_time = 0.0
+        self._wait_time = 0.0
+
+        self._draw_hist = Histogram()
+        self._queue_hist = Histogram()
+        self._dropped = 0
+
+        self._frame_cache = None
+        self._cache_len = 0
+        self._cache_pos = 0
+
+        self._buffers = []
+        self._generations = {}
 
         self._input_queue = None
         if hasattr(driver, 'input_manager') and driver.input_manager is not None:
@@ -124,6 +153,19 @@ class Renderer(HasTraits, object):
         return False
 
 
+    @property
+    def period(self) -> int:
+        """
+        Number of frames in one full cycle of the effect, or None
+
+        Effects which repeat exactly after a fixed number of frames
+        (as long as no traits change) should return the length of
+        the cycle. The first cycle is then recorded and replayed
+        until a trait changes, instead of calling draw() again.
+        """
+        return None
+
+
     @property
     def has_key_input(self) -> bool:
         """
@@ -138,6 +180,8 @@ class Renderer(HasTraits, object):
         Gets the duration (in seconds) that key events will remain
         available.
         """
+        if self._input_queue is None:
+            return 0.0
         return self._input_queue.expire_time
 
 
@@ -147,9 +191,10 @@ class Renderer(HasTraits, object):
         Set the duration (in seconds) that key events should remain
         in the queue for. This allows the renderer to act on groups
         of key events over time. If zero, events are not kept after
-        being dequeued.
+        being dequeued. Ignored if the device has no key input.
         """
-        self._input_queue.expire_time = expire_time
+        if self._input_queue is not None:
+            self._input_queue.expire_time = expire_time
 
 
     async def get_input_events(self):
@@ -162,13 +207,187 @@ class Renderer(HasTraits, object):
         if not self.has_key_input or not self._input_queue.attach():
             raise ValueError('Input events are not supported for this device')
 
-        events = await self._input_queue.get_events()
+        events = await self._wait_for(self._input_queue.get_events())
         return events
 
 
+    async def _wait_for(self, awaitable):
+        """
+        Await an external event (such as input) during draw. Time
+        spent waiting here is not counted as drawing time.
+        """
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._wait_time += time.perf_counter() - start
+
+
     @observe('fps')
     def _fps_changed(self, change):
-        self._tick.interval = 1 / self.fps
+        self._update_interval()
+
+
+    def _update_interval(self):
+        fps = self.fps
+        if self._fps_limit is not None:
+            fps = min(fps, self._fps_limit)
+        self._tick.interval = 1 / fps
+
+
+    def _set_fps_limit(self, limit: float=None):
+        """
+        Limit the frame rate below the requested fps without
+        changing the trait. Used by the frame rate governor.
+
+        :param limit: Maximum frame rate, or None to remove the limit
+        """
+        self._fps_limit = limit
+        self._update_interval()
+
+
+    @property
+    def effective_fps(self) -> float:
+        """
+        The frame rate this renderer is actually running at, which
+        may be lower than fps if it has been throttled.
+        """
+        return 1 / self._tick.interval
+
+
+    @property
+    def stats(self) -> OrderedDict:
+        """
+        Performance statistics for this renderer: histograms of
+        draw time and time spent waiting for a free buffer, and
+        the number of drawn buffers which were never displayed.
+        """
+        return OrderedDict([('draw', self._draw_hist.as_dict()),
+                            ('queue_wait', self._queue_hist.as_dict()),
+                            ('dropped', self._dropped)])
+
+
+    def _drop_layer(self, layer):
+        """
+        Return a layer which was drawn but never displayed
+
+        Called by AnimationLoop. Implementations should not call this directly.
+        """
+        self._dropped += 1
+        self._free_layer(layer)
+
+
+    @property
+    def draw_time(self) -> float:
+        """
+        Duration (in seconds) of the most recent draw
+        """
+        return self._draw_time
+
+
+    @observe(All)
+    def _invalidate_cache(self, change=None):
+        if change is not None:
+            if change.name in UNCACHED_TRAITS or \
+                    not self.traits()[change.name].get_metadata('config'):
+                return
+
+        self._frame_cache = None
+
+
+    def _rebuild(self, name: str, func, *args):
+        """
+        Rebuild derived state (such as a gradient) in the background
+
+        Calls func(*args) on a worker thread and stores the result in
+        the attribute with the given name once it's ready. The previous
+        value is used for drawing until then, so changing a trait never
+        stalls the animation. If another rebuild of the same attribute
+        is requested in the meantime, the older result is discarded.
+
+        The function runs right away if no event loop is running, or
+        if there is no previous value to draw with. It must not touch
+        the renderer, so pass everything it needs as arguments.
+
+        :param name: Name of the attribute to update, or a tuple of
+                     names if func returns a tuple of values which
+                     must change together
+        :param func: Function which computes the new value
+        :param args: Arguments for the function
+        """
+        global _rebuild_executor
+
+        generation = self._generations.get(name, 0) + 1
+        self._generations[name] = generation
+
+        names = name if isinstance(name, tuple) else (name,)
+
+        def _store(value):
+            if isinstance(name, tuple):
+                for attr, val in zip(names, value):
+                    setattr(self, attr, val)
+            else:
+                setattr(self, name, value)
+
+        loop = asyncio.get_event_loop()
+        if not loop.is_running() or getattr(self, names[0], None) is None:
+            _store(func(*args))
+            return
+
+        if _rebuild_executor is None:
+            _rebuild_executor = futures.ThreadPoolExecutor(max_workers=1)
+
+        def _done(future):
+            if future.cancelled() or self._generations.get(name) != generation:
+                return
+
+            err = future.exception()
+            if err is not None:
+                self.logger.exception('Failed to rebuild %s', name, exc_info=err)
+                return
+
+            _store(future.result())
+
+            # frames recorded meanwhile used the old state
+            self._frame_cache = None
+
+        loop.run_in_executor(_rebuild_executor, functools.partial(func, *args)) \
+                .add_done_callback(_done)
+
+
+    async def _draw_cached(self, layer, timestamp) -> bool:
+        """
+        Draw the layer, recording the first cycle of a periodic
+        effect and replaying it afterwards.
+        """
+        period = self.period
+        if period is None or period <= 0 or \
+                period * self.height * self.width * 4 > MAX_CACHE_BYTES:
+            self._frame_cache = None
+            return await self.draw(layer, timestamp)
+
+        cache = self._frame_cache
+        if cache is None or cache.shape[0] != period:
+            cache = np.empty((period, self.height, self.width, 4), dtype=np.uint8)
+            self._frame_cache = cache
+            self._cache_len = 0
+            self._cache_pos = 0
+
+        if self._cache_len < period:
+            status = await self.draw(layer, timestamp)
+
+            # discard if traits changed while drawing
+            if status and cache is self._frame_cache:
+                np.clip(layer.matrix, 0.0, 1.0, out=layer.matrix)
+                np.rint(layer.matrix * 255.0, out=cache[self._cache_len], casting='unsafe')
+                self._cache_len += 1
+
+            return status
+
+        np.multiply(cache[self._cache_pos], 1.0 / 255.0, out=layer.matrix)
+        self._cache_pos = (self._cache_pos + 1) % period
+
+        return True
 
 
     @property
@@ -179,6 +398,29 @@ class Renderer(HasTraits, object):
         return self._logger
 
 
+    @observe('background_color', 'blend_mode', 'opacity')
+    def _layer_traits_changed(self, change):
+        for layer in self._buffers:
+            setattr(layer, change.name, change.new)
+
+
+    def _add_buffer(self, layer):
+        """
+        Take ownership of a new layer and make it available for drawing
+
+        The layer picks up the background color, blend mode and opacity
+        of this renderer, and is kept up to date when they change.
+
+        Called by AnimationLoop. Implementations should not call this directly.
+        """
+        layer.background_color = self.background_color
+        layer.blend_mode = self.blend_mode
+        layer.opacity = self.opacity
+
+        self._buffers.append(layer)
+        self._free_layer(layer)
+
+
     def _free_layer(self, layer):
         """
         Clear the layer and return it to the queue
@@ -204,14 +446,17 @@ class Renderer(HasTraits, object):
         while self.running:
             async with self._tick:
                 # get a buffer, blocking if necessary
+                start = time.perf_counter()
                 layer = await self._avail_q.get()
-                layer.background_color = self.background_color
-                layer.blend_mode = self.blend_mode
-                layer.opacity = self.opacity
+                self._queue_hist.record(time.perf_counter() - start)
 
                 try:
                     # draw the layer
-                    status = await self.draw(layer, asyncio.get_event_loop().time())
+                    self._wait_time = 0.0
+                    start = time.perf_counter()
+                    status = await self._draw_cached(layer, asyncio.get_event_loop().time())
+                    self._draw_time = time.perf_counter() - start - self._wait_time
+                    self._draw_hist.record(self._draw_time)
                 except Exception as err:
                     self.logger.exception("Exception in renderer, exiting now!", exc_info=err)
                     self.logger.error('Renderer traits: %s', self._trait_values)
@@ -231,10 +476,12 @@ class Renderer(HasTraits, object):
     def _flush(self):
         if self.running:
             return
+        self._buffers = []
         for qlen in range(0, self._avail_q.qsize()):
             self._avail_q.get_nowait()
         for qlen in range(0, self._active_q.qsize()):
             self._active_q.get_nowait()
+            self._dropped += 1
 
 
     async def _stop(self):
@@ -249,3 +496,80 @@ class Renderer(HasTraits, object):
             await self._input_queue.detach()
 
         self.logger.info("Renderer stopped: z=%d", self.zindex)
+
+
+class ShaderRenderer(Renderer):
+    """
+    Base class for effects defined as a function of pixel position
+    and time.
+
+    Implementations override shade(), which is evaluated once per
+    frame over the whole matrix using NumPy arrays, so effects are
+    vectorized without any per-pixel Python code. Traits can be
+    used from shade() as usual. For example:
+
+        class Pulse(ShaderRenderer):
+            meta = RendererMeta('Pulse', 'Pulsing red', 'Someone', '1.0')
+
+            def shade(self, x, y, t):
+                level = 0.5 + 0.5 * np.sin(t * 2.0 + x * 6.0)
+                return np.stack((level, np.zeros_like(level), np.zeros_like(level)), axis=-1)
+    """
+
+    # base class only, not an effect of its own
+    _abstract = True
+
+    def __init__(self, *args, **kwargs):
+        super(ShaderRenderer, self).__init__(*args, **kwargs)
+
+        self._x = None
+        self._y = None
+        self._start_time = None
+
+
+    def init(self, frame) -> bool:
+        """
+        Sets up the coordinate arrays. Implementations which override
+        this must call the superclass.
+        """
+        self._y, self._x = frame.geometry.normalized
+        self._start_time = None
+        return True
+
+
+    @abstractmethod
+    def shade(self, x: np.ndarray, y: np.ndarray, t: float) -> np.ndarray:
+        """
+        Compute the colors of every pixel
+
+        :param x: Horizontal position of each pixel, shape (height, width).
+                  Scaled so the width spans [0, 1)
+        :param y: Vertical position of each pixel, on the same scale as x
+        :param t: Time since the effect started, in seconds
+
+        :return: Array of RGBA (or RGB) colors which can be broadcast to
+                 (height, width, 4) or (height, width, 3)
+        """
+        return None
+
+
+    async def draw(self, layer: Layer, timestamp: float) -> bool:
+        if self._start_time is None:
+            self._start_time = timestamp
+
+        colors = np.asarray(self.shade(self._x, self._y, timestamp - self._start_time))
+        layer.put_array(np.broadcast_to(colors, (layer.height, layer.width, colors.shape[-1])))
+
+        return True
+
+
+def iter_subclasses(cls: type):
+    """
+    Walk all subclasses of a class, including indirect ones
+
+    :param cls: The base class
+    :return: generator of classes
+    """
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from iter_subclasses(subclass)
@@ -15,23 +15,35 @@
 
 import asyncio
 import inspect
+import os
+import time
+import weakref
 
 from collections import OrderedDict
+from collections.abc import Mapping
 from concurrent import futures
 from types import ModuleType
 from typing import NamedTuple
 
+import numpy as np
+
 from pkg_resources import iter_entry_points
-from traitlets import Bool, HasTraits, List, observe
+from traitlets import Bool, Float, HasTraits, List, observe
 
+from uchroma.layer import Layer
 from uchroma.log import LOG_TRACE
-from uchroma.renderer import MAX_FPS, NUM_BUFFERS, Renderer, RendererMeta
+from uchroma.renderer import iter_subclasses, MAX_FPS, NUM_BUFFERS, Renderer, RendererMeta
 from uchroma.traits import FrozenDict, get_args_dict
-from uchroma.util import ensure_future, Signal, Ticker
+from uchroma.util import ensure_future, Histogram, Signal, Ticker
 
 from .frame import Frame
 
 
+DEFAULT_FPS_FLOOR = 5.0
+DEFAULT_TRANSITION_TIME = 0.5
+TRANSITIONS = ('crossfade', 'wipe')
+WARM_POOL_SIZE = 4
+
 class LayerHolder(HasTraits):
 
     def __init__(self, renderer: Renderer, frame: Frame,
@@ -44,7 +56,9 @@ class LayerHolder(HasTraits):
 
         self.waiter = None
         self.active_buf = None
+        self.shown = False
         self.task = None
+        self.transition = None
 
         self.traits_changed = Signal()
         self._renderer.observe(self._traits_changed, names=['all'])
@@ -54,7 +68,7 @@ class LayerHolder(HasTraits):
         for buf in range(0, NUM_BUFFERS):
             layer = self._frame.create_layer()
             layer.blend_mode = self._blend_mode
-            self._renderer._free_layer(layer)
+            self._renderer._add_buffer(layer)
 
 
     @property
@@ -90,8 +104,22 @@ class LayerHolder(HasTraits):
             self.task = ensure_future(self.renderer._run())
 
 
+    @property
+    def output_buf(self):
+        """
+        The buffer which is composed for this layer, which is the
+        mix of both layers while a transition is running
+        """
+        if self.transition is not None:
+            return self.transition.output
+        return self.active_buf
+
+
     async def stop(self):
+        self._renderer.unobserve(self._traits_changed, names=['all'])
+
         if self.renderer.running:
+            buffers = self.renderer._buffers
 
             tasks = []
             if self.task is not None and not self.task.done():
@@ -109,6 +137,333 @@ class LayerHolder(HasTraits):
 
             self.renderer.finish(self._frame)
 
+            # hand the buffers back for the next renderer
+            for buf in buffers:
+                self._frame.release_layer(buf)
+            self.active_buf = None
+
+        if self.transition is not None:
+            self.transition.release()
+            self.transition = None
+
+
+class Transition(object):
+    """
+    Timed transition between an outgoing and an incoming layer
+
+    The last image of the outgoing layer is frozen into a pooled
+    buffer, and mixed with the output of the incoming renderer while
+    composing each frame. The mix is computed with a single vectorized
+    ramp: a scalar for a crossfade, or one weight per column for a
+    wipe from left to right. The buffers are returned to the pool
+    when the transition is done.
+    """
+
+    # width of the soft edge of a wipe, in columns
+    WIPE_EDGE = 2.0
+
+    def __init__(self, frame: Frame, kind: str, duration: float, outgoing: Layer):
+        if kind not in TRANSITIONS:
+            raise ValueError('Unknown transition: %s' % kind)
+
+        self._frame = frame
+        self._kind = kind
+        self._duration = max(duration, 1e-3)
+        self._start = time.perf_counter()
+
+        self._outgoing = frame.create_layer()
+        self._outgoing.background_color = outgoing.background_color
+        self._outgoing.blend_mode = outgoing.blend_mode
+        self._outgoing.opacity = outgoing.opacity
+        np.copyto(self._outgoing.matrix, outgoing.matrix)
+
+        self._mixed = frame.create_layer()
+        self._output = self._outgoing
+
+        self._mix = None
+        self._cols = None
+        if kind == 'wipe':
+            self._cols = np.arange(frame.width, dtype=np.float64).reshape(1, frame.width, 1)
+            self._mix = np.empty_like(self._cols)
+
+        self.done = False
+
+
+    @property
+    def output(self) -> Layer:
+        """
+        The layer which was produced by the last call to apply
+        """
+        return self._output
+
+
+    def _ramp(self, progress: float):
+        if self._kind == 'crossfade':
+            return progress
+
+        # per-column weight with a soft edge moving across the matrix
+        edge = Transition.WIPE_EDGE
+        np.subtract(progress * (self._frame.width + edge), self._cols, out=self._mix)
+        np.multiply(self._mix, 1.0 / edge, out=self._mix)
+        np.clip(self._mix, 0.0, 1.0, out=self._mix)
+        return self._mix
+
+
+    def apply(self, incoming: Layer) -> Layer:
+        """
+        Mix the frozen outgoing layer with the incoming layer
+        according to the time elapsed since the transition started.
+
+        :param incoming: The current buffer of the incoming renderer,
+                         or None if it hasn't produced one yet
+        :return: The layer to compose
+        """
+        progress = (time.perf_counter() - self._start) / self._duration
+
+        if incoming is None:
+            self._output = self._outgoing
+
+        elif progress >= 1.0:
+            self._output = incoming
+            self.done = True
+
+        else:
+            mixed = self._mixed
+            np.subtract(incoming.matrix, self._outgoing.matrix, out=mixed.matrix)
+            np.multiply(mixed.matrix, self._ramp(progress), out=mixed.matrix)
+            np.add(mixed.matrix, self._outgoing.matrix, out=mixed.matrix)
+
+            mixed.background_color = incoming.background_color
+            mixed.blend_mode = incoming.blend_mode
+            mixed.opacity = incoming.opacity
+            self._output = mixed
+
+        return self._output
+
+
+    def release(self):
+        """
+        Return the buffers of this transition to the pool
+        """
+        if self._outgoing is None:
+            return
+
+        self._frame.release_layer(self._outgoing)
+        self._frame.release_layer(self._mixed)
+        self._outgoing = self._mixed = None
+
+
+class FrameRateGovernor(object):
+    """
+    Adapts the frame rate of each layer to the available headroom
+
+    The cost of a layer is the time spent drawing it plus the time
+    spent composing and uploading the frame to the hardware. If a
+    layer regularly misses the deadline for its current frame rate,
+    or the system is heavily loaded, the rate is lowered (down to
+    the floor). Once the layer could comfortably run faster again,
+    the rate is raised back towards the rate the renderer asked for.
+    """
+
+    # how often to adjust rates, in seconds
+    ADJUST_INTERVAL = 1.0
+
+    # fraction of missed deadlines before throttling
+    MISS_THRESHOLD = 0.2
+
+    # fraction of the frame budget a layer may use after speeding up
+    HEADROOM = 0.6
+
+    # load average per CPU above which we consider the system busy
+    MAX_LOAD = 1.0
+
+    STEP_DOWN = 0.75
+    STEP_UP = 1.25
+
+    def __init__(self, floor: float=DEFAULT_FPS_FLOOR):
+        self.floor = floor
+
+        self._last_adjust = time.perf_counter()
+        self._stats = {}
+
+
+    @staticmethod
+    def _system_loaded() -> bool:
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1) > FrameRateGovernor.MAX_LOAD
+        except OSError:
+            return False
+
+
+    def update(self, layers: list, frame: Frame):
+        """
+        Record the cost of the frame which was just committed, and
+        adjust the rate of each layer if it's time to do so.
+
+        Only layers which delivered a new buffer for this frame are
+        sampled, the draw time of a layer which is still showing an
+        older buffer says nothing about this frame.
+
+        :param layers: The LayerHolders which delivered a new buffer
+        :param frame: The frame which was committed
+        """
+        output_time = frame.compose_time + frame.upload_time
+
+        for layer in layers:
+            renderer = layer.renderer
+            cost = renderer.draw_time + output_time
+            frames, misses, peak = self._stats.get(renderer, (0, 0, 0.0))
+            if cost > 1.0 / renderer.effective_fps:
+                misses += 1
+            self._stats[renderer] = (frames + 1, misses, max(peak, cost))
+
+        now = time.perf_counter()
+        if now - self._last_adjust < FrameRateGovernor.ADJUST_INTERVAL:
+            return
+
+        self._last_adjust = now
+        loaded = FrameRateGovernor._system_loaded()
+
+        for renderer in list(self._stats.keys()):
+            self._adjust(renderer, loaded)
+
+        self._stats.clear()
+
+
+    def _adjust(self, renderer: Renderer, loaded: bool):
+        if renderer not in self._stats:
+            return
+
+        frames, misses, peak = self._stats[renderer]
+        current = renderer.effective_fps
+        floor = min(self.floor, renderer.fps)
+
+        if loaded or misses / frames > FrameRateGovernor.MISS_THRESHOLD:
+            target = max(floor, current * FrameRateGovernor.STEP_DOWN)
+        elif misses == 0 and current < renderer.fps:
+            target = min(renderer.fps, current * FrameRateGovernor.STEP_UP)
+            if peak * target > FrameRateGovernor.HEADROOM:
+                return
+        else:
+            return
+
+        if target == current:
+            return
+
+        if target >= renderer.fps:
+            renderer._set_fps_limit(None)
+        else:
+            renderer._set_fps_limit(target)
+
+        renderer.logger.debug("Governor: fps %.1f -> %.1f (misses=%d/%d loaded=%s)",
+                              current, target, misses, frames, loaded)
+
+
+    def reset(self, renderer: Renderer):
+        """
+        Remove any limit placed on the renderer
+        """
+        self._stats.pop(renderer, None)
+        renderer._set_fps_limit(None)
+
+
+def _freeze(value):
+    """
+    Hashable representation of a trait value
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return tuple(_freeze(v) for v in value)
+
+
+def _config_values(renderer: Renderer) -> tuple:
+    return _freeze({name: getattr(renderer, name) \
+            for name in renderer.trait_names(config=True)})
+
+
+class RendererPool(object):
+    """
+    Bounded pool of recently stopped renderers
+
+    Renderers are keyed by name and requested traits, so switching back
+    to a recently used effect or preset reuses the instance instead
+    of constructing a new one. A renderer keeps its internal state
+    (including the recorded cycle of a periodic effect) while it is
+    in the pool. The least recently used renderer is dropped when
+    the pool is full.
+    """
+    def __init__(self, size: int=WARM_POOL_SIZE):
+        self._size = size
+        self._pool = OrderedDict()
+        self._keys = weakref.WeakKeyDictionary()
+
+
+    def track(self, renderer: Renderer, name: str, traits: dict):
+        """
+        Remember how a new renderer was created, so it can be
+        found again once it is stopped.
+
+        :param renderer: The new renderer
+        :param name: Key name of the renderer
+        :param traits: Traits the renderer was created with
+        """
+        self._keys[renderer] = (name, _freeze(traits), _config_values(renderer))
+
+
+    def get(self, name: str, traits: dict) -> Renderer:
+        """
+        Take a renderer out of the pool
+
+        :param name: Key name of the renderer
+        :param traits: The requested traits
+        :return: The renderer, or None if there is no match
+        """
+        try:
+            return self._pool.pop((name, _freeze(traits)))
+        except (KeyError, TypeError):
+            return None
+
+
+    def put(self, renderer: Renderer):
+        """
+        Put a stopped renderer in the pool
+
+        It is stored under the traits it was created with. A renderer
+        whose configurable traits have changed since then could never
+        match a later request, so it is not pooled.
+
+        :param renderer: The stopped renderer
+        """
+        if self._size <= 0 or renderer not in self._keys:
+            return
+
+        name, traits, values = self._keys[renderer]
+        if _config_values(renderer) != values:
+            del self._keys[renderer]
+            return
+
+        key = (name, traits)
+        self._pool.pop(key, None)
+        self._pool[key] = renderer
+
+        while len(self._pool) > self._size:
+            self._pool.popitem(last=False)
+
+
+    def clear(self):
+        """
+        Drop all renderers
+        """
+        self._pool.clear()
+
 
 class AnimationLoop(HasTraits):
     layers = List(default_value=(), allow_none=False)
@@ -132,11 +487,12 @@ class AnimationLoop(HasTraits):
     does not wake up spuriously or otherwise consume cycles while inactive.
     """
     def __init__(self, frame: Frame, default_blend_mode: str=None,
-                 *args, **kwargs):
+                 governor: FrameRateGovernor=None, *args, **kwargs):
         super(AnimationLoop, self).__init__(*args, **kwargs)
 
         self._frame = frame
         self._default_blend_mode = default_blend_mode
+        self._governor = governor
 
         self._anim_task = None
 
@@ -146,6 +502,10 @@ class AnimationLoop(HasTraits):
         self._logger = frame._driver.logger
         self._error = False
         self.layers_changed = Signal()
+        self.renderer_stopped = Signal()
+
+        self._compose_hist = Histogram()
+        self._upload_hist = Histogram()
 
 
     @observe('layers')
@@ -162,6 +522,22 @@ class AnimationLoop(HasTraits):
             self.stop()
 
 
+    @staticmethod
+    def _swap_buffer(layer: LayerHolder, buf):
+        """
+        Make buf the active buffer of the layer and return the
+        previous buffer to the renderer.
+        """
+        if layer.active_buf is not None:
+            if layer.shown:
+                layer.renderer._free_layer(layer.active_buf)
+            else:
+                layer.renderer._drop_layer(layer.active_buf)
+
+        layer.active_buf = buf
+        layer.shown = False
+
+
     async def _dequeue(self, r_idx: int):
         """
         Gather completed layers from the renderers. If nothing
@@ -178,12 +554,8 @@ class AnimationLoop(HasTraits):
         # wait for a buffer
         buf = await renderer._active_q.get()
 
-        # return the old buffer to the renderer
-        if layer.active_buf is not None:
-            renderer._free_layer(layer.active_buf)
-
         # put it on the active list
-        layer.active_buf = buf
+        self._swap_buffer(layer, buf)
 
 
     def _dequeue_nowait(self, r_idx) -> bool:
@@ -203,12 +575,8 @@ class AnimationLoop(HasTraits):
             buf = renderer._active_q.get_nowait()
             if buf is not None:
 
-                # return the last buffer
-                if layer.active_buf is not None:
-                    renderer._free_layer(layer.active_buf)
-
                 # put it on the composition list
-                layer.active_buf = buf
+                self._swap_buffer(layer, buf)
                 return True
 
         return False
@@ -231,7 +599,12 @@ class AnimationLoop(HasTraits):
         if len(waiters) == 0:
             return
 
-        await asyncio.wait(waiters, return_when=futures.FIRST_COMPLETED)
+        # keep composing at full rate while a transition or fade is running
+        timeout = None
+        if self._frame.fading or any(layer.transition is not None for layer in self.layers):
+            timeout = 1 / MAX_FPS
+
+        await asyncio.wait(waiters, timeout=timeout, return_when=futures.FIRST_COMPLETED)
 
         # check the rest without waiting
         for r_idx in range(0, len(self.layers)):
@@ -248,14 +621,37 @@ class AnimationLoop(HasTraits):
         if self._logger.isEnabledFor(LOG_TRACE - 1):
             self._logger.debug("Layers: %s", self.layers)
 
-        active_bufs = [layer.active_buf for layer in \
-                sorted(self.layers, key=lambda z: z.zindex) \
-                if layer is not None and layer.active_buf is not None]
+        active_bufs = []
+        for layer in sorted(self.layers, key=lambda z: z.zindex):
+            if layer is None:
+                continue
+
+            buf = layer.active_buf
+            if layer.transition is not None:
+                buf = layer.transition.apply(buf)
+                if layer.transition.done:
+                    layer.transition.release()
+                    layer.transition = None
+
+            if buf is not None:
+                active_bufs.append(buf)
 
         try:
             if len(active_bufs) > 0:
                 self._frame.commit(active_bufs)
 
+                self._compose_hist.record(self._frame.compose_time)
+                self._upload_hist.record(self._frame.upload_time)
+
+                fresh = [layer for layer in self.layers \
+                        if not layer.shown and layer.active_buf is not None]
+
+                for layer in self.layers:
+                    layer.shown = True
+
+                if self._governor is not None:
+                    self._governor.update(fresh, self._frame)
+
         except (OSError, IOError):
             self._error = True
             await self._stop()
@@ -294,6 +690,15 @@ class AnimationLoop(HasTraits):
                 await self._commit_layers()
 
 
+    @property
+    def stats(self) -> OrderedDict:
+        """
+        Histograms of compose and upload time for this loop
+        """
+        return OrderedDict([('compose', self._compose_hist.as_dict()),
+                            ('upload', self._upload_hist.as_dict())])
+
+
     def _renderer_done(self, future):
         """
         Invoked when the renderer exits
@@ -357,6 +762,10 @@ class AnimationLoop(HasTraits):
                 layer_id = id(self.layers[zindex])
                 await layer.stop()
 
+                if self._governor is not None:
+                    self._governor.reset(layer.renderer)
+                self.renderer_stopped.fire(layer.renderer)
+
                 tmp = self.layers[:]
                 del tmp[zindex]
                 self._update_z(tmp)
@@ -366,6 +775,83 @@ class AnimationLoop(HasTraits):
                 self._logger.info("Layer %d removed", zindex)
 
 
+    def replace_layer(self, zindex: int, renderer: Renderer, transition: str=None,
+                      duration: float=DEFAULT_TRANSITION_TIME) -> bool:
+        """
+        Replace the renderer of a layer, optionally with a transition
+
+        The new renderer is initialized right away and takes over the
+        buffers of the old one once it has stopped. Until the new
+        renderer produces output, the last image of the old renderer
+        stays on screen, so there is no visible gap.
+
+        :param zindex: Z-index of the layer to replace
+        :param renderer: The new renderer
+        :param transition: One of TRANSITIONS, or None to switch immediately
+        :param duration: Duration of the transition, in seconds
+
+        :return: True if the renderer was initialized
+        """
+        if zindex < 0 or zindex >= len(self.layers):
+            raise ValueError("Z-index out of range (requested %d max %d)" % \
+                    (zindex, len(self.layers) - 1))
+
+        if transition is not None and transition not in TRANSITIONS:
+            raise ValueError('Unknown transition: %s' % transition)
+
+        if not renderer.init(self._frame):
+            self._logger.error('Renderer %s failed to initialize', renderer.name)
+            return False
+
+        old = self.layers[zindex]
+        outgoing = old.output_buf
+
+        if outgoing is not None and self.running:
+            if transition is None:
+                transition = 'crossfade'
+                duration = 0.0
+            fade = Transition(self._frame, transition, duration, outgoing)
+        else:
+            fade = None
+
+        ensure_future(self._swap_layer(old, renderer, fade))
+        return True
+
+
+    async def _swap_layer(self, old: LayerHolder, renderer: Renderer, fade: Transition):
+        old_id = id(old)
+        await old.stop()
+
+        if self._governor is not None:
+            self._governor.reset(old.renderer)
+        self.renderer_stopped.fire(old.renderer)
+
+        if old not in self.layers:
+            if fade is not None:
+                fade.release()
+            return
+
+        with self.hold_trait_notifications():
+            zindex = self.layers.index(old)
+
+            layer = LayerHolder(renderer, self._frame, self._default_blend_mode)
+            layer.transition = fade
+
+            tmp = self.layers[:]
+            tmp[zindex] = layer
+            self._update_z(tmp)
+
+            layer.traits_changed.connect(self._layer_traits_changed)
+
+            if self.running:
+                layer.start()
+
+        self._logger.info("Layer replaced, renderer=%s zindex=%d", renderer, zindex)
+
+        self.layers_changed.fire('remove', zindex, old_id, error=self._error)
+        self.layers_changed.fire('add', zindex, renderer, error=self._error)
+
+
     async def clear_layers(self):
         if len(self.layers) == 0:
             return False
@@ -457,6 +943,7 @@ class AnimationManager(HasTraits):
 
     _renderer_info = FrozenDict()
     paused = Bool(False)
+    fps_floor = Float(min=1.0, max=MAX_FPS, default_value=DEFAULT_FPS_FLOOR)
 
     def __init__(self, driver):
         super(AnimationManager, self).__init__()
@@ -465,6 +952,8 @@ class AnimationManager(HasTraits):
         self._loop = None
         self._logger = driver.logger
         self._error = False
+        self._governor = FrameRateGovernor(self.fps_floor)
+        self._warm = RendererPool()
 
         self.layers_changed = Signal()
         self.state_changed = Signal()
@@ -489,6 +978,11 @@ class AnimationManager(HasTraits):
         self.state_changed.fire(value)
 
 
+    @observe('fps_floor')
+    def _fps_floor_changed(self, change):
+        self._governor.floor = change.new
+
+
     def _loop_running_changed(self, change):
         try:
             self._driver.reset()
@@ -510,9 +1004,11 @@ class AnimationManager(HasTraits):
 
     def _create_loop(self):
         if self._loop is None:
-            self._loop = AnimationLoop(self._driver.frame_control)
+            self._loop = AnimationLoop(self._driver.frame_control,
+                                       governor=self._governor)
             self._loop.observe(self._loop_running_changed, names=['running'])
             self._loop.layers_changed.connect(self._loop_layers_changed)
+            self._loop.renderer_stopped.connect(self._warm.put)
 
 
     def _update_prefs(self):
@@ -544,13 +1040,15 @@ class AnimationManager(HasTraits):
                 self._logger.error("Plugin %s is not a renderer, skipping", ep_cls)
                 continue
 
-        for obj in Renderer.__subclasses__():
-            if inspect.isabstract(obj):
+        for obj in iter_subclasses(Renderer):
+            if inspect.isabstract(obj) or obj.__dict__.get('_abstract', False):
                 continue
 
             if obj.meta.display_name == '_unknown_':
-                self._logger.error("Renderer %s did not set metadata, skipping",
-                                   obj.__name__)
+                # base classes for other renderers don't need metadata
+                if len(obj.__subclasses__()) == 0:
+                    self._logger.error("Renderer %s did not set metadata, skipping",
+                                       obj.__name__)
                 continue
 
             key = '%s.%s' % (obj.__module__, obj.__name__)
@@ -563,16 +1061,24 @@ class AnimationManager(HasTraits):
 
     def _get_renderer(self, name, zindex: int=None, **traits) -> Renderer:
         """
-        Instantiate a renderer
+        Instantiate a renderer, or reuse a recently stopped
+        one with the same traits
 
         :param name: Name of the discovered renderer
 
         :return: The renderer object
         """
+        renderer = self._warm.get(name, traits)
+        if renderer is not None:
+            self._logger.debug('Reusing warm renderer: %s', name)
+            return renderer
+
         info = self._renderer_info[name]
 
         try:
-            return info.clazz(self._driver, **traits)
+            renderer = info.clazz(self._driver, **traits)
+            self._warm.track(renderer, name, traits)
+            return renderer
 
         except ImportError as err:
             self._logger.exception('Invalid renderer: %s', name, exc_info=err)
@@ -615,6 +1121,38 @@ class AnimationManager(HasTraits):
         return renderer.zindex
 
 
+    def replace_renderer(self, zindex: int, name, traits: dict, transition: str=None,
+                         duration: float=DEFAULT_TRANSITION_TIME) -> int:
+        """
+        Replaces the renderer of an existing layer. The switch happens
+        inside the compositor, so the old output stays on screen until
+        the new renderer has drawn, optionally with a timed transition.
+
+        :param zindex: Z-index of the layer to replace
+        :param name: Key name of a discovered renderer
+        :param traits: Traits for the new renderer
+        :param transition: One of TRANSITIONS, or None to switch immediately
+        :param duration: Duration of the transition, in seconds
+
+        :return: Z-position of the new renderer or -1 on error
+        """
+        if self._loop is None or zindex is None or zindex < 0 \
+                or zindex >= len(self._loop.layers):
+            self._logger.error("Z-index out of range (requested %s)", zindex)
+            return -1
+
+        renderer = self._get_renderer(name, **traits)
+        if renderer is None:
+            self._logger.error('Renderer %s failed to load', name)
+            return -1
+
+        if not self._loop.replace_layer(zindex, renderer, transition, duration):
+            self._logger.error('Renderer %s failed to initialize', name)
+            return -1
+
+        return zindex
+
+
     def remove_renderer(self, zindex: int) -> bool:
         if self._loop is None:
             return False
@@ -659,6 +1197,7 @@ class AnimationManager(HasTraits):
             return
 
         await self._loop.clear_layers()
+        self._warm.clear()
 
 
     def _restore_prefs(self, prefs):
@@ -686,6 +1225,17 @@ class AnimationManager(HasTraits):
         return self._renderer_info
 
 
+    @property
+    def stats(self) -> OrderedDict:
+        """
+        Performance statistics of the animation loop, empty
+        if no animation has been started
+        """
+        if self._loop is None:
+            return OrderedDict()
+        return self._loop.stats
+
+
     @property
     def running(self):
         """
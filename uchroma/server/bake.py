@@ -0,0 +1,205 @@
+#
+# uchroma - Copyright (C) 2017 Steve Kondik
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+
+# pylint: disable=invalid-name
+
+"""
+Animation baking
+
+Runs any renderer against a virtual Frame and stores the output,
+along with the frame rate, as an uncompressed .npz file which can
+be memory-mapped and played back with the Playback renderer. Complex effects can then be shipped at the
+runtime cost of a slice and a copy per frame.
+"""
+
+import argparse
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+from pkg_resources import iter_entry_points
+
+from uchroma.fxlib.playback import save_animation
+from uchroma.log import Log
+from uchroma.renderer import iter_subclasses, Renderer
+from uchroma.traits import add_traits_to_argparse, apply_from_argparse
+
+from .frame import Frame
+
+
+class VirtualDevice(object):
+    """
+    Minimal stand-in for a device driver which lets
+    renderers run without any hardware attached.
+    """
+    def __init__(self, width: int, height: int, name: str='Virtual'):
+        self.width = width
+        self.height = height
+        self.name = name
+        self.key = 'virtual'
+        self.input_manager = None
+        self.logger = Log.get('uchroma.bake')
+
+
+def find_renderers() -> dict:
+    """
+    Find all installed renderers
+
+    :return: dict of renderer classes keyed by module.ClassName
+    """
+    for ep_mod in iter_entry_points(group='uchroma.plugins'):
+        ep_mod.load()
+
+    renderers = {}
+    for obj in iter_subclasses(Renderer):
+        if inspect.isabstract(obj) or obj.meta.display_name == '_unknown_':
+            continue
+        renderers['%s.%s' % (obj.__module__, obj.__name__)] = obj
+
+    return renderers
+
+
+def get_renderer_class(name: str):
+    """
+    Look up a renderer by key, class name, or display name
+
+    :param name: The name of the renderer, case insensitive
+    :return: The renderer class, or None if not found
+    """
+    name = name.lower()
+    for key, clazz in find_renderers().items():
+        if name in (key.lower(), clazz.__name__.lower(), clazz.meta.display_name.lower()):
+            return clazz
+    return None
+
+
+def bake(renderer: Renderer, path: str, frames: int, dtype=np.uint8) -> int:
+    """
+    Run a renderer against a virtual Frame and store the output
+
+    The renderer must already be configured. Frames are drawn back
+    to back with timestamps spaced according to the renderer's fps,
+    which is stored in the file so the result plays back at the same
+    speed as the live effect.
+
+    :param renderer: The configured renderer instance
+    :param path: Path of the .npz file to create
+    :param frames: Number of frames to bake
+    :param dtype: np.uint8 or np.float32
+
+    :return: The number of frames written
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.uint8, np.float32):
+        raise ValueError('Unsupported dtype: %s' % dtype)
+
+    frame = Frame(VirtualDevice(renderer.width, renderer.height),
+                  renderer.width, renderer.height)
+
+    if not renderer.init(frame):
+        if not renderer.has_key_input:
+            raise ValueError('Renderer %s failed to initialize, renderers which respond '
+                             'to key presses can\'t be baked' % renderer.__class__.__name__)
+        raise ValueError('Renderer %s failed to initialize' % renderer.__class__.__name__)
+
+    frames_path = '%s.frames.npy' % path
+    out = np.lib.format.open_memmap(frames_path, mode='w+', dtype=dtype,
+                                    shape=(frames, renderer.height, renderer.width, 4))
+
+    loop = asyncio.get_event_loop()
+    layer = frame.create_layer()
+    layer.background_color = renderer.background_color
+    layer.blend_mode = renderer.blend_mode
+    layer.opacity = renderer.opacity
+    start = time.time()
+    interval = 1.0 / renderer.fps
+
+    try:
+        for idx in range(0, frames):
+            layer.clear()
+
+            loop.run_until_complete(renderer.draw(layer, start + (idx * interval)))
+
+            if dtype == np.uint8:
+                np.rint(np.clip(layer.matrix, 0.0, 1.0) * 255.0, out=layer.matrix)
+            out[idx] = layer.matrix
+
+        out.flush()
+        del out
+
+        save_animation(path, frames_path, renderer.fps)
+
+    finally:
+        renderer.finish(frame)
+        if os.path.exists(frames_path):
+            os.unlink(frames_path)
+
+    return frames
+
+
+def run_bake():
+    parser = argparse.ArgumentParser(description='Bake a renderer into an animation file',
+                                     add_help=False)
+    parser.add_argument('renderer', help='Renderer to bake')
+    parser.add_argument('output', help='Output .npz file')
+    parser.add_argument('-W', '--width', type=int, required=True,
+                        help='Width of the lighting matrix')
+    parser.add_argument('-H', '--height', type=int, required=True,
+                        help='Height of the lighting matrix')
+    parser.add_argument('-n', '--frames', type=int, default=150,
+                        help='Number of frames to bake')
+    parser.add_argument('--float', action='store_true',
+                        help='Store float32 instead of uint8')
+    parser.add_argument('-h', '--help', action='store_true',
+                        help='Show this help message and exit')
+
+    args, remaining = parser.parse_known_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    clazz = get_renderer_class(args.renderer)
+    if clazz is None:
+        if args.help:
+            parser.print_help()
+            sys.exit(0)
+        parser.error('Unknown renderer: %s (available: %s)' % \
+                (args.renderer, ', '.join(find_renderers().keys())))
+
+    renderer = clazz(VirtualDevice(args.width, args.height))
+
+    # the renderer's own traits become additional options
+    add_traits_to_argparse(renderer, parser)
+    if args.help:
+        parser.print_help()
+        sys.exit(0)
+
+    apply_from_argparse(parser.parse_args(), target=renderer)
+
+    dtype = np.float32 if args.float else np.uint8
+    try:
+        count = bake(renderer, args.output, args.frames, dtype=dtype)
+    except ValueError as err:
+        parser.error(str(err))
+
+    print('Baked %d frames of %s (%dx%d @ %.1f fps) to %s' % \
+            (count, clazz.meta.display_name, args.width, args.height,
+             renderer.fps, args.output))
+
+
+if __name__ == '__main__':
+    run_bake()
@@ -97,6 +97,7 @@ class DeviceAPI(object):
                    'device_type': 's',
                    'driver_version': 's',
                    'firmware_version': 's',
+                   'frame_stream_path': 's',
                    'has_matrix': 'b',
                    'height': 'i',
                    'is_charging': 'b',
@@ -504,7 +505,13 @@ class LayerAPI(TraitsPropertiesMixin, ManagedService):
         if change.old != change.new:
             if change.new:
                 self.publish()
-            elif self._handle != None:
+                return
+
+            # renderers may be reused by a new layer
+            self._delegate.unobserve(self._z_changed, names=['zindex'])
+            self._delegate.unobserve(self._state_changed, names=['running'])
+
+            if self._handle != None:
                 self._logger.info("Layer stopped zindex=%d (%s)",
                                   self._zindex, self._delegate.meta)
                 self.unpublish()
@@ -531,6 +538,16 @@ class LayerAPI(TraitsPropertiesMixin, ManagedService):
         return self._zindex
 
 
+    @property
+    def EffectiveFps(self) -> float:
+        return self._delegate.effective_fps
+
+
+    @property
+    def RenderStats(self) -> dict:
+        return dbus_prepare(self._delegate.stats, variant=True)[0]
+
+
     def publish(self):
         if not self._delegate.running:
             return
@@ -567,6 +584,9 @@ class LayerAPI(TraitsPropertiesMixin, ManagedService):
                                         self._delegate.__class__.__name__))
         builder.add_property('Key', 's')
 
+        builder.add_property('EffectiveFps', 'd')
+        builder.add_property('RenderStats', 'a{sv}')
+
         return builder.build()
 
 
@@ -581,6 +601,15 @@ class AnimationManagerAPI(ManagedService):
                 <arg direction='out' type='o' name='layer' />
             </method>
 
+            <method name='ReplaceRenderer'>
+                <arg direction='in' type='s' name='name' />
+                <arg direction='in' type='i' name='zindex' />
+                <arg direction='in' type='a{sv}' name='traits' />
+                <arg direction='in' type='s' name='transition' />
+                <arg direction='in' type='d' name='duration' />
+                <arg direction='out' type='o' name='layer' />
+            </method>
+
             <method name='RemoveRenderer'>
                 <arg direction='in' type='i' name='zindex' />
                 <arg direction='out' type='b' name='status' />
@@ -603,6 +632,10 @@ class AnimationManagerAPI(ManagedService):
             <property name='AnimationState' type='s' access='read'>
                 <annotation name='org.freedesktop.DBus.Property.EmitsChangedSignal' value='true' />
             </property>
+
+            <property name='FpsFloor' type='d' access='readwrite' />
+
+            <property name='LoopStats' type='a{sv}' access='read' />
         </interface>
     </node>
     """
@@ -675,6 +708,20 @@ class AnimationManagerAPI(ManagedService):
         return None
 
 
+    def ReplaceRenderer(self, name: str, zindex: int, traits: dict,
+                        transition: str, duration: float) -> str:
+        self._logger.debug('ReplaceRenderer: name=%s zindex=%d traits=%s transition=%s',
+                           name, zindex, traits, transition)
+        if transition == '':
+            transition = None
+
+        z = self._animgr.replace_renderer(zindex, name, traits=traits,
+                                          transition=transition, duration=duration)
+        if z >= 0:
+            return LayerAPI.get_layer_path(self._path, z)
+        return None
+
+
     def RemoveRenderer(self, zindex: int) -> bool:
         return self._animgr.remove_renderer(zindex)
 
@@ -692,6 +739,21 @@ class AnimationManagerAPI(ManagedService):
         return self._state
 
 
+    @property
+    def FpsFloor(self) -> float:
+        return self._animgr.fps_floor
+
+
+    @FpsFloor.setter
+    def FpsFloor(self, value: float):
+        self._animgr.fps_floor = value
+
+
+    @property
+    def LoopStats(self) -> dict:
+        return dbus_prepare(self._animgr.stats, variant=True)[0]
+
+
 
 class DeviceManagerAPI(object):
     """
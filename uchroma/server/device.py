@@ -18,6 +18,7 @@ from .fx import FXManager
 from .hardware import Hardware, Quirks
 from .led import LED, LEDManager
 from .standard_fx import StandardFX
+from .stream import FrameStream
 from .types import LEDType
 
 class UChromaDevice(BaseUChromaDevice):
@@ -36,6 +37,7 @@ class UChromaDevice(BaseUChromaDevice):
         self._led_manager = LEDManager(self)
 
         self._frame_control = None
+        self._frame_stream = None
 
 
     def get_led(self, led_type: LEDType) -> LED:
@@ -69,6 +71,35 @@ class UChromaDevice(BaseUChromaDevice):
         return self._frame_control
 
 
+    @property
+    def frame_stream(self) -> FrameStream:
+        """
+        Gets the FrameStream which accepts raw frames from external
+        programs over a Unix domain socket
+
+        :return: The FrameStream interface
+        """
+        if self.width == 0 or self.height == 0:
+            return None
+
+        if self._frame_stream is None:
+            self._frame_stream = FrameStream(self)
+
+        return self._frame_stream
+
+
+    @property
+    def frame_stream_path(self) -> str:
+        """
+        The path of the Unix socket used for streaming raw frames.
+        The socket is only listening while a Stream renderer is active.
+        """
+        if self.frame_stream is None:
+            return ''
+
+        return self.frame_stream.path
+
+
     def _set_brightness(self, level: float) -> bool:
         if self.has_quirk(Quirks.SCROLL_WHEEL_BRIGHTNESS):
             self.get_led(LEDType.SCROLL_WHEEL).brightness = level
@@ -97,6 +128,15 @@ class UChromaDevice(BaseUChromaDevice):
         return self.hardware.supported_leds
 
 
+    def _software_fade(self) -> bool:
+        # brightness of these devices isn't the brightness of the matrix
+        if self.has_quirk(Quirks.SCROLL_WHEEL_BRIGHTNESS) or \
+                self.has_quirk(Quirks.LOGO_LED_BRIGHTNESS):
+            return False
+
+        return self.is_animating and self._frame_control is not None
+
+
     @property
     def led_manager(self) -> LEDManager:
         return self._led_manager
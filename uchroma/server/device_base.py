@@ -21,6 +21,7 @@ import hidapi
 from wrapt import synchronized
 
 from uchroma.log import Log
+from uchroma.renderer import MAX_FPS
 from uchroma.util import ensure_future, Signal, ValueAnimator
 from uchroma.version import __version__
 
@@ -32,6 +33,9 @@ from .report import RazerReport
 from .types import BaseCommand
 
 
+# duration of a fade over the full brightness range, in seconds
+BRIGHTNESS_FADE_TIME = 1.5
+
 class BaseUChromaDevice(object):
     """
     Base class for device objects
@@ -79,7 +83,12 @@ class BaseUChromaDevice(object):
         if self.width > 0 and self.height > 0:
             self._animation_manager = AnimationManager(self)
 
-        self._brightness_animator = ValueAnimator(self._update_brightness)
+        # the hardware level is the whole brightness, so restore the scale
+        self._brightness_animator = ValueAnimator( \
+                functools.partial(self._update_brightness, scale=1.0),
+                max_time=BRIGHTNESS_FADE_TIME)
+        self._fade_task = None
+        self._fade_serial = 0
 
         self._fx_manager = None
 
@@ -205,14 +214,97 @@ class BaseUChromaDevice(object):
         return 0.0
 
 
-    async def _update_brightness(self, level):
+    async def _update_brightness(self, level, scale: float=None):
+        """
+        Set the hardware brightness level
+
+        :param level: The new level, 0 - 100
+        :param scale: Software brightness scale to apply to the frame
+                      together with the new hardware level
+        """
+        frame = None
+        if scale is not None:
+            frame = getattr(self, 'frame_control', None)
+
+        def set_level():
+            self._set_brightness(level)
+            if frame is not None:
+                frame.set_brightness_scale(scale)
+
         await ensure_future(asyncio.get_event_loop().run_in_executor( \
-                self._executor, functools.partial(self._set_brightness, level)))
+                self._executor, set_level))
 
         suspended = self.suspended and level == 0
         self.power_state_changed.fire(level, suspended)
 
 
+    def _software_fade(self) -> bool:
+        """
+        True if brightness changes can be faded in software by
+        scaling the output of the animation. Implementations should
+        only allow this while an animation is running.
+        """
+        return False
+
+
+    async def _fade_brightness(self, level: float):
+        """
+        Fade to a brightness level by scaling the composed frames,
+        so the hardware level is only changed once.
+        """
+        serial = self._fade_serial
+        frame = self.frame_control
+        current = await asyncio.get_event_loop().run_in_executor( \
+                self._executor, self._get_brightness)
+        apparent = current * frame.brightness_scale
+        duration = (abs(level - apparent) / 100.0) * BRIGHTNESS_FADE_TIME
+
+        done = False
+        try:
+            if level >= current:
+                # raise the hardware level first and fade in from the current level
+                if level > 0:
+                    await self._update_brightness(level, apparent / level)
+                    frame.fade(apparent / level, 1.0, duration)
+                    await asyncio.sleep(duration)
+                else:
+                    await self._update_brightness(level)
+
+            else:
+                # fade out, then lower the hardware level
+                frame.fade(frame.brightness_scale, level / current, duration)
+
+                await asyncio.sleep(duration)
+
+                # wait for the final step to be displayed
+                for _ in range(3):
+                    if not frame.fading:
+                        break
+                    await asyncio.sleep(1 / MAX_FPS)
+                await self._update_brightness(level, 1.0)
+
+            done = True
+
+        finally:
+            # a fade which takes over continues from the apparent level,
+            # anything else only sets the hardware level
+            if not done and serial == self._fade_serial:
+                frame.set_brightness_scale(1.0)
+
+
+    def _animate_brightness(self, start: float, level: float):
+        if self._fade_task is not None and not self._fade_task.done():
+            self._fade_task.cancel()
+
+        if self._software_fade():
+            self._brightness_animator.cancel()
+            self._fade_serial += 1
+            self._fade_task = ensure_future(self._fade_brightness(level))
+            self._fade_task.add_done_callback(self._done_cb)
+        else:
+            self._brightness_animator.animate(start, level, done_cb=self._done_cb)
+
+
     @property
     def suspended(self):
         """
@@ -236,8 +328,7 @@ class BaseUChromaDevice(object):
             self._set_brightness(0)
         else:
             if self._device_open():
-                self._brightness_animator.animate(self.brightness, 0,
-                                                  done_cb=self._done_cb)
+                self._animate_brightness(self.brightness, 0)
 
         self._suspended = True
 
@@ -277,8 +368,7 @@ class BaseUChromaDevice(object):
         """
         if not self._suspended:
             if self._device_open():
-                self._brightness_animator.animate(self.brightness, level,
-                                                  done_cb=self._done_cb)
+                self._animate_brightness(self.brightness, level)
 
         self.preferences.brightness = level
 
@@ -13,6 +13,7 @@
 
 # pylint: disable=invalid-name, too-many-arguments, no-member
 
+import threading
 import time
 import warnings
 
@@ -22,6 +23,7 @@ from uchroma.blending import blend
 from uchroma.color import ColorUtils
 from uchroma.layer import Layer
 
+from .geometry import Geometry
 from .hardware import Quirks
 from .types import BaseCommand
 
@@ -62,9 +64,37 @@ class Frame(object):
         self._logger = driver.logger
 
         self._report = None
+        self._geometry = None
+        self._layer_pool = []
 
         self._debug_opts = {}
 
+        self._compose_time = 0.0
+        self._upload_time = 0.0
+
+        self._brightness_scale = 1.0
+        self._fade = None
+        self._pending_scale = None
+        self._scale_lock = threading.Lock()
+
+        # choose the composition and upload paths for this layout once
+        self._has_align = hasattr(driver, 'align_key_matrix')
+        self._has_row_offset = hasattr(driver, 'get_row_offset')
+
+        if height == 1:
+            # only the columns which are sent to the hardware are composed
+            self._compose_width = min(width, Frame.MAX_WIDTH)
+            self._pack = self._set_frame_data_single
+        elif width > Frame.MAX_WIDTH:
+            self._compose_width = width
+            self._pack = self._set_frame_data_split
+        else:
+            self._compose_width = width
+            self._pack = self._set_frame_data_matrix
+
+        self._rgb = np.empty((height, self._compose_width, 3), dtype=np.float64)
+        self._img = np.empty((height, self._compose_width, 3), dtype=np.uint8)
+
 
     def create_layer(self) -> Layer:
         """
@@ -74,8 +104,32 @@ class Frame(object):
         advanced effects or stacked animations. Currently
         only layers which match the physical size of the
         lighting matrix are supported.
+
+        Layers returned with release_layer are reused, so
+        switching renderers doesn't allocate new buffers.
         """
-        return Layer(self._width, self._height, logger=self._logger)
+        if len(self._layer_pool) == 0:
+            return Layer(self._width, self._height, logger=self._logger)
+
+        layer = self._layer_pool.pop()
+        layer.lock(False)
+        layer.clear()
+        layer.background_color = None
+        layer.blend_mode = None
+        layer.opacity = 1.0
+        return layer
+
+
+    def release_layer(self, layer: Layer):
+        """
+        Return a layer which is no longer used to the pool, so
+        it can be handed out again by create_layer. The layer
+        must not be drawn to or composed after this call.
+
+        :param layer: A layer created by this Frame
+        """
+        if layer.width == self._width and layer.height == self._height:
+            self._layer_pool.append(layer)
 
 
     @property
@@ -102,6 +156,18 @@ class Frame(object):
         return self._height
 
 
+    @property
+    def geometry(self) -> Geometry:
+        """
+        Coordinate grids, key positions and distance fields for this
+        Frame, shared by all renderers.
+        """
+        if self._geometry is None:
+            self._geometry = Geometry(self._width, self._height,
+                                      getattr(self._driver, 'key_mapping', None))
+        return self._geometry
+
+
     @property
     def debug_opts(self) -> dict:
         """
@@ -111,8 +177,98 @@ class Frame(object):
         return self._debug_opts
 
 
+    @property
+    def compose_time(self) -> float:
+        """
+        Duration (in seconds) of the most recent composition
+        """
+        return self._compose_time
+
+
+    @property
+    def upload_time(self) -> float:
+        """
+        Duration (in seconds) of the most recent upload to the hardware
+        """
+        return self._upload_time
+
+
+    @property
+    def brightness_scale(self) -> float:
+        """
+        Factor applied to the composed image, as of the most recent
+        commit or as set for the next one
+        """
+        pending = self._pending_scale
+        if pending is not None:
+            return pending
+        return self._brightness_scale
+
+
+    @property
+    def fading(self) -> bool:
+        """
+        True if a brightness fade is in progress
+        """
+        return self._fade is not None
+
+
+    def fade(self, start: float, end: float, duration: float=0.0):
+        """
+        Fade the brightness of the composed image in software
+
+        The scale moves linearly from start to end over the duration,
+        updated on every commit. This allows brightness changes to be
+        animated without sending a command to the hardware for every
+        step. The scale is kept once the fade is done.
+
+        :param start: Starting scale, 0.0 - 1.0
+        :param end: Final scale, 0.0 - 1.0
+        :param duration: Duration of the fade, in seconds
+        """
+        with self._scale_lock:
+            self._pending_scale = None
+            self._fade = (time.perf_counter(), duration, start, end)
+
+
+    def set_brightness_scale(self, scale: float):
+        """
+        Set the brightness scale of the next commit, cancelling any fade
+
+        Unlike fade(), this may be called from another thread, so the
+        scale can be handed over right after the hardware brightness
+        level has been changed.
+
+        :param scale: The new scale, 0.0 - 1.0
+        """
+        with self._scale_lock:
+            self._pending_scale = scale
+
+
+    def _fade_step(self) -> float:
+        with self._scale_lock:
+            pending, self._pending_scale = self._pending_scale, None
+            if pending is not None:
+                self._fade = None
+                self._brightness_scale = pending
+            fade = self._fade
+
+        if fade is not None:
+            fade_start, duration, start, end = fade
+
+            progress = 1.0
+            if duration > 0:
+                progress = min(1.0, (time.perf_counter() - fade_start) / duration)
+            if progress >= 1.0:
+                self._fade = None
+
+            self._brightness_scale = start + (end - start) * progress
+
+        return self._brightness_scale
+
+
     @staticmethod
-    def compose(layers: list) -> np.ndarray:
+    def compose(layers: list, brightness: float=1.0) -> np.ndarray:
         """
         Render a list of Layers into an RGB image
 
@@ -121,6 +277,9 @@ class Frame(object):
         by each layer) then alpha-composited into a single RGB image
         before sending to the hardware. If the background color is
         set on a layer, it is only honored if it is the base layer.
+
+        :param layers: The layers to compose, by z-order
+        :param brightness: Scale applied to the final image
         """
         if len(layers) == 0:
             return None
@@ -135,9 +294,51 @@ class Frame(object):
                     layer = layers[l_idx]
                     if layer is None or layer.matrix.ndim < 3:
                         continue
-                    out = blend(out, layer.matrix, layer.blend_mode, layer.opacity)
+                    out = blend(out, layer.matrix, layer.blend_op, layer.opacity)
+
+            img = ColorUtils.rgba2rgb(out, bg_color=layers[0].background_color)
+            if brightness != 1.0:
+                np.multiply(img, brightness, out=img, casting='unsafe')
+
+            return img
+
+
+    def _compose(self, layers: list, brightness: float) -> np.ndarray:
+        """
+        Same as compose, but only covers the columns which are sent to
+        the hardware, and renders into buffers owned by this Frame. The
+        returned image is only valid until the next call.
+        """
+        if len(layers) == 0:
+            return None
+
+        cols = self._compose_width
+        out = layers[0].matrix[:, :cols]
+
+        # blend all the layers by z-order
+        if len(layers) > 1:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                for layer in layers[1:]:
+                    if layer is None or layer.matrix.ndim < 3:
+                        continue
+                    out = blend(out, layer.matrix[:, :cols], layer.blend_op, layer.opacity)
+
+        # alpha-composite against the background color
+        rgb = self._rgb
+        alpha = out[..., 3:]
+        np.multiply(out[..., :3], alpha, out=rgb)
 
-            return ColorUtils.rgba2rgb(out, bg_color=layers[0].background_color)
+        bg_color = layers[0].background_color
+        if bg_color is not None:
+            rgb += (1.0 - alpha) * np.array(tuple(bg_color)[:3], dtype=np.float64)
+
+        np.clip(rgb, 0.0, 1.0, out=rgb)
+        np.multiply(rgb, 255.0 * brightness, out=rgb)
+        np.rint(rgb, out=rgb)
+        np.copyto(self._img, rgb, casting='unsafe')
+
+        return self._img
 
 
     def _set_frame_data_single(self, img, frame_id: int):
@@ -163,38 +364,46 @@ class Frame(object):
         return self._report
 
 
-    def _set_frame_data_matrix(self, img, frame_id: int):
-        width = self._width
-        multi = False
+    def _row_offset(self, row: int) -> int:
+        if self._has_row_offset:
+            return self._driver.get_row_offset(self, row)
+        return 0
 
-        #perform two updates if we exceeded 24 columns
-        if width > Frame.MAX_WIDTH:
-            multi = True
-            width = int(width / 2)
 
-        if hasattr(self._driver, 'align_key_matrix'):
+    def _set_frame_data_matrix(self, img, frame_id: int):
+        if self._has_align:
             img = self._driver.align_key_matrix(self, img)
 
         for row in range(0, self._height):
-            rowdata = img[row]
+            data = img[row][:self._width]
+            start_col = self._row_offset(row)
 
-            start_col = 0
-            if hasattr(self._driver, 'get_row_offset'):
-                start_col = self._driver.get_row_offset(self, row)
+            self._driver.run_report(self._get_frame_data_report(self._height - row - 1, \
+                frame_id, row, start_col, len(data) - 1, data))
+
+            time.sleep(0.001)
 
-            remaining = self._height - row - 1
-            if multi:
-                remaining = (remaining * 2) + 1
+
+    def _set_frame_data_split(self, img, frame_id: int):
+        # perform two updates per row if we exceeded 24 columns
+        width = int(self._width / 2)
+
+        if self._has_align:
+            img = self._driver.align_key_matrix(self, img)
+
+        for row in range(0, self._height):
+            rowdata = img[row]
+            start_col = self._row_offset(row)
+            remaining = ((self._height - row - 1) * 2) + 1
 
             data = rowdata[:width]
             self._driver.run_report(self._get_frame_data_report(remaining, \
                 frame_id, row, start_col, len(data) - 1, data))
 
-            if multi:
-                time.sleep(0.001)
-                data = rowdata[width:]
-                self._driver.run_report(self._get_frame_data_report(remaining - 1, \
-                    frame_id, row, width, width + len(data) - 1, data))
+            time.sleep(0.001)
+            data = rowdata[width:]
+            self._driver.run_report(self._get_frame_data_report(remaining - 1, \
+                frame_id, row, width, width + len(data) - 1, data))
 
             time.sleep(0.001)
 
@@ -203,10 +412,7 @@ class Frame(object):
         if frame_id is None:
             frame_id = Frame.DEFAULT_FRAME_ID
 
-        if self._height == 1:
-            self._set_frame_data_single(img, frame_id)
-        else:
-            self._set_frame_data_matrix(img, frame_id)
+        self._pack(img, frame_id)
 
 
     def _set_custom_frame(self):
@@ -226,11 +432,17 @@ class Frame(object):
 
         :return: This Frame instance
         """
-        img = Frame.compose(layers)
+        start = time.perf_counter()
+        img = self._compose(layers, self._fade_step())
+        composed = time.perf_counter()
+
         self._set_frame_data(img, frame_id)
         if show:
             self._set_custom_frame()
 
+        self._compose_time = composed - start
+        self._upload_time = time.perf_counter() - composed
+
         return self
 
 
@@ -240,6 +452,8 @@ class Frame(object):
 
         :return: This frame instance
         """
-        self.commit([self.create_layer()], show=False)
+        layer = self.create_layer()
+        self.commit([layer], show=False)
+        self.release_layer(layer)
 
         return self
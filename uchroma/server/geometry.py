@@ -0,0 +1,182 @@
+#
+# uchroma - Copyright (C) 2017 Steve Kondik
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+
+# pylint: disable=invalid-name
+
+import math
+
+import numpy as np
+
+
+class Geometry(object):
+    """
+    Cache of coordinate grids and key positions for a lighting matrix
+
+    Everything is built lazily on first use and shared by all
+    renderers drawing to the same Frame. The returned arrays are
+    read-only and must not be modified.
+    """
+    def __init__(self, width: int, height: int, key_mapping=None):
+        self._width = width
+        self._height = height
+        self._key_mapping = key_mapping
+
+        self._grid = None
+        self._normalized = None
+        self._distances = {}
+        self._key_indices = {}
+        self._key_distances = {}
+
+
+    @staticmethod
+    def _freeze(arr: np.ndarray) -> np.ndarray:
+        arr.flags.writeable = False
+        return arr
+
+
+    @property
+    def width(self) -> int:
+        """
+        The width of the matrix
+        """
+        return self._width
+
+
+    @property
+    def height(self) -> int:
+        """
+        The height of the matrix
+        """
+        return self._height
+
+
+    @property
+    def diagonal(self) -> float:
+        """
+        Length of the diagonal of the matrix
+        """
+        return math.hypot(self._width, self._height)
+
+
+    @property
+    def grid(self) -> tuple:
+        """
+        Row and column of every pixel, as a pair of integer
+        arrays of shape (height, width)
+        """
+        if self._grid is None:
+            rows, cols = np.indices((self._height, self._width))
+            self._grid = (Geometry._freeze(rows), Geometry._freeze(cols))
+        return self._grid
+
+
+    @property
+    def normalized(self) -> tuple:
+        """
+        Position of every pixel scaled so the width spans [0, 1),
+        as a pair of float arrays (y, x) of shape (height, width).
+        Both axes use the same scale, so the aspect ratio is kept.
+        """
+        if self._normalized is None:
+            rows, cols = self.grid
+            self._normalized = (Geometry._freeze(rows / self._width),
+                                Geometry._freeze(cols / self._width))
+        return self._normalized
+
+
+    def distances(self, row_scale: float=1.0) -> np.ndarray:
+        """
+        Distance from every pixel to every other pixel
+
+        The result has shape (height, width, height, width) and
+        distances[row, col] is the distance field of that pixel.
+
+        :param row_scale: Factor applied to vertical distances, for
+                          layouts where rows are further apart than columns
+        :return: Array of distances
+        """
+        if row_scale not in self._distances:
+            rows, cols = self.grid
+            dist = np.hypot((rows[..., np.newaxis, np.newaxis] - rows) * row_scale,
+                            cols[..., np.newaxis, np.newaxis] - cols)
+            self._distances[row_scale] = Geometry._freeze(dist)
+        return self._distances[row_scale]
+
+
+    def _inside(self, points) -> list:
+        return [(pt[0], pt[1]) for pt in points \
+                if 0 <= pt[0] < self._height and 0 <= pt[1] < self._width]
+
+
+    def points_index(self, points) -> np.ndarray:
+        """
+        Flat indices into a (height * width) buffer of the given
+        points. Points outside the matrix are ignored.
+
+        :param points: Iterable of (row, col) points
+        :return: Array of indices
+        """
+        return np.array([(row * self._width) + col for row, col in self._inside(points)],
+                        dtype=np.intp)
+
+
+    def points_distance(self, points, row_scale: float=1.0) -> np.ndarray:
+        """
+        Distance field of a group of points, which is the distance
+        from every pixel to the nearest of the points.
+
+        :param points: Iterable of (row, col) points
+        :param row_scale: Factor applied to vertical distances
+        :return: Array of shape (height, width), or None if no points are
+                 inside the matrix
+        """
+        points = self._inside(points)
+        if len(points) == 0:
+            return None
+
+        rows, cols = zip(*points)
+        return np.amin(self.distances(row_scale)[rows, cols], axis=0)
+
+
+    def key_index(self, keycode: str) -> np.ndarray:
+        """
+        Flat indices of all pixels covered by a key
+
+        :param keycode: The keycode from the key mapping
+        :return: Array of indices, or None if the key isn't mapped
+        """
+        if keycode not in self._key_indices:
+            index = None
+            if self._key_mapping is not None and keycode in self._key_mapping:
+                index = Geometry._freeze(self.points_index(self._key_mapping[keycode]))
+            self._key_indices[keycode] = index
+        return self._key_indices[keycode]
+
+
+    def key_distance(self, keycode: str, row_scale: float=1.0) -> np.ndarray:
+        """
+        Distance field of a key
+
+        :param keycode: The keycode from the key mapping
+        :param row_scale: Factor applied to vertical distances
+        :return: Array of shape (height, width), or None if the key isn't mapped
+        """
+        cache_key = (keycode, row_scale)
+        if cache_key not in self._key_distances:
+            field = None
+            if self._key_mapping is not None and keycode in self._key_mapping:
+                field = self.points_distance(self._key_mapping[keycode], row_scale)
+                if field is not None:
+                    field = Geometry._freeze(field)
+            self._key_distances[cache_key] = field
+        return self._key_distances[cache_key]
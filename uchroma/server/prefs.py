@@ -23,6 +23,7 @@ import ruamel.yaml as yaml
 
 from grapefruit import Color
 
+from uchroma.color import ColorArray
 from uchroma.util import Singleton
 
 from .config import Configuration
@@ -106,3 +107,13 @@ def construct_color(loader, node):
 
 yaml.RoundTripDumper.add_representer(Color, represent_color)
 yaml.RoundTripLoader.add_constructor(u'!color', construct_color)
+
+
+def represent_colors(dumper, data):
+    return dumper.represent_sequence(u'!colors', data.to_html())
+
+def construct_colors(loader, node):
+    return ColorArray(loader.construct_sequence(node))
+
+yaml.RoundTripDumper.add_representer(ColorArray, represent_colors)
+yaml.RoundTripLoader.add_constructor(u'!colors', construct_colors)
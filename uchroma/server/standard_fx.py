@@ -16,6 +16,8 @@
 from abc import abstractmethod
 from enum import Enum
 
+import numpy as np
+
 from traitlets import Bool, Int, Unicode
 
 from uchroma.color import ColorUtils
@@ -384,13 +386,12 @@ class StandardFX(FXModule):
 
             layer = frame.create_layer()
 
-            data = []
             gradient = ColorUtils.hue_gradient( \
                 self.length, layer.width + (layer.height * self.stagger))
-            for row in range(0, layer.height):
-                data.append([gradient[(row * self.stagger) + col] for col in range(0, layer.width)])
+            rows, cols = np.indices((layer.height, layer.width))
+            np.take(gradient.astype(layer.matrix.dtype), (rows * self.stagger) + cols,
+                    axis=0, out=layer.matrix)
 
-            layer.put_all(data)
             frame.commit([layer])
 
             return True
@@ -0,0 +1,264 @@
+#
+# uchroma - Copyright (C) 2017 Steve Kondik
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, version 3.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY
+# or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+
+# pylint: disable=invalid-name
+
+"""
+Raw frame streaming
+
+External programs (ambient lighting, game integrations, etc) can push
+complete frames to a device over a Unix domain socket, which is far
+cheaper than sending matrices over D-Bus. The socket path for each
+device is published as the FrameStreamPath property of the device.
+
+Each frame is a fixed header followed by the pixel data:
+
+    magic:    4 bytes, b'UCFS'
+    width:    uint16, little endian
+    height:   uint16, little endian
+    channels: uint8, 3 (RGB) or 4 (RGBA)
+    data:     width * height * channels bytes of uint8, row-major
+
+The dimensions must match the lighting matrix of the device. Frames
+are not queued: if frames arrive faster than they can be displayed,
+only the most recent one is shown.
+"""
+
+import asyncio
+import os
+import stat
+import struct
+import tempfile
+
+import numpy as np
+
+from uchroma.renderer import MAX_FPS, Renderer, RendererMeta
+from uchroma.util import ensure_future
+
+
+FRAME_MAGIC = b'UCFS'
+FRAME_HEADER = struct.Struct('<4sHHB')
+
+
+class FrameStream(object):
+    """
+    Per-device Unix socket server which accepts raw frames
+
+    Only the latest frame received is kept, older frames which
+    were never picked up by the renderer are discarded.
+    """
+    def __init__(self, driver):
+        self._driver = driver
+        self._logger = driver.logger
+
+        self._server = None
+        self._frame = None
+        self._frame_ready = asyncio.Event()
+
+        self._users = 0
+        self._lock = asyncio.Lock()
+
+
+    @property
+    def path(self) -> str:
+        """
+        Filesystem path of the socket for this device
+        """
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir())
+        return os.path.join(runtime_dir, 'uchroma', 'frame-%s.sock' % \
+                            self._driver.key.replace(':', '_'))
+
+
+    @property
+    def running(self) -> bool:
+        """
+        True if the socket is accepting connections
+        """
+        return self._server is not None
+
+
+    def acquire(self):
+        """
+        Register a user of the stream, and start listening
+        if this is the first one
+        """
+        self._users += 1
+        ensure_future(self._update())
+
+
+    def release(self):
+        """
+        Unregister a user of the stream, and stop listening
+        once the last one is gone
+        """
+        self._users = max(0, self._users - 1)
+        ensure_future(self._update())
+
+
+    async def _update(self):
+        # start and stop one at a time, following the current number
+        # of users, so a late stop can't close a newer user's socket
+        async with self._lock:
+            if self._users > 0:
+                await self.start()
+            else:
+                await self.stop()
+
+
+    def _check_dir(self, dirname: str) -> bool:
+        os.makedirs(dirname, mode=0o700, exist_ok=True)
+
+        info = os.lstat(dirname)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+            self._logger.error("Refusing to use %s for the frame stream, "
+                               "it is not a directory owned by us", dirname)
+            return False
+
+        if stat.S_IMODE(info.st_mode) != 0o700:
+            os.chmod(dirname, 0o700)
+
+        return True
+
+
+    async def start(self):
+        """
+        Start listening on the socket
+        """
+        if self._server is not None:
+            return
+
+        path = self.path
+        if not self._check_dir(os.path.dirname(path)):
+            return
+
+        if os.path.exists(path):
+            os.unlink(path)
+
+        self._server = await asyncio.start_unix_server(self._handle_client, path=path)
+        os.chmod(path, 0o600)
+
+        self._logger.info("Frame stream listening on %s", path)
+
+
+    async def stop(self):
+        """
+        Stop listening and remove the socket
+        """
+        if self._server is None:
+            return
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._frame = None
+        self._logger.info("Frame stream closed")
+
+
+    async def get_frame(self) -> np.ndarray:
+        """
+        Get the most recent frame, yielding until one is available.
+
+        :return: Array of uint8 with shape (height, width, channels)
+        """
+        while self._frame is None:
+            self._frame_ready.clear()
+            await self._frame_ready.wait()
+
+        frame, self._frame = self._frame, None
+        return frame
+
+
+    def _parse_header(self, header: bytes):
+        magic, width, height, channels = FRAME_HEADER.unpack(header)
+
+        if magic != FRAME_MAGIC:
+            raise ValueError('Bad frame magic: %s' % magic)
+
+        if width != self._driver.width or height != self._driver.height:
+            raise ValueError('Frame size %dx%d does not match device (%dx%d)' % \
+                    (width, height, self._driver.width, self._driver.height))
+
+        if channels not in (3, 4):
+            raise ValueError('Unsupported number of channels: %d' % channels)
+
+        return width, height, channels
+
+
+    async def _handle_client(self, reader, writer):
+        self._logger.debug("Frame stream client connected")
+
+        try:
+            while True:
+                width, height, channels = self._parse_header( \
+                        await reader.readexactly(FRAME_HEADER.size))
+
+                data = await reader.readexactly(width * height * channels)
+
+                # latest frame wins
+                self._frame = np.frombuffer(data, dtype=np.uint8) \
+                        .reshape(height, width, channels)
+                self._frame_ready.set()
+
+        except asyncio.IncompleteReadError:
+            pass
+
+        except ValueError as err:
+            self._logger.error("Frame stream protocol error: %s", err)
+
+        finally:
+            writer.close()
+            self._logger.debug("Frame stream client disconnected")
+
+
+class StreamRenderer(Renderer):
+    """
+    Displays frames pushed by an external program over the
+    device's frame stream socket.
+    """
+
+    # meta
+    meta = RendererMeta('Stream', 'Display frames streamed from another program',
+                        'Steve Kondik', '1.0')
+
+
+    def __init__(self, driver, *args, **kwargs):
+        super(StreamRenderer, self).__init__(driver, *args, **kwargs)
+
+        self._stream = None
+        if hasattr(driver, 'frame_stream'):
+            self._stream = driver.frame_stream
+
+        self.fps = MAX_FPS
+
+
+    def init(self, frame) -> bool:
+        if self._stream is None:
+            return False
+
+        self._stream.acquire()
+        return True
+
+
+    def finish(self, frame):
+        if self._stream is not None:
+            self._stream.release()
+
+
+    async def draw(self, layer, timestamp):
+        layer.put_array(await self._wait_for(self._stream.get_frame()))
+
+        return True
@@ -24,7 +24,7 @@ from traitlets import CaselessStrEnum, Container, Dict, Enum, Int, HasTraits, \
         List, TraitType, Undefined, UseEnum
 from frozendict import frozendict
 
-from uchroma.color import to_color
+from uchroma.color import ColorArray, to_color
 from uchroma.util import ArgsDict
 
 
@@ -54,6 +54,9 @@ class ColorTrait(TraitType):
 class ColorSchemeTrait(List):
     """
     A list of ColorTraits which comprise a scheme
+
+    A ColorArray may also be assigned, which is unpacked
+    into individual colors.
     """
     info_text = 'a list of colors'
 
@@ -62,6 +65,11 @@ class ColorSchemeTrait(List):
         super(ColorSchemeTrait, self).__init__(trait=trait, default_value=default_value,
                                                minlen=minlen, maxlen=maxlen, **kwargs)
 
+    def validate(self, obj, value):
+        if isinstance(value, ColorArray):
+            value = value.to_colors()
+        return super(ColorSchemeTrait, self).validate(obj, value)
+
 
 class ColorPresetTrait(UseEnum):
     """
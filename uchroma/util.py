@@ -18,6 +18,8 @@ Various helper functions that are used across the library.
 """
 
 import asyncio
+import bisect
+import functools
 import inspect
 import math
 import re
@@ -28,10 +30,46 @@ import typing
 from collections import OrderedDict
 
 from numpy import interp
-from wrapt import decorator, synchronized
+from wrapt import synchronized
 
 
-AUTOCAST_CACHE = {}
+def _autocast_plan(func, type_hint) -> tuple:
+    """
+    Work out where the arguments annotated with type_hint will
+    be found when func is called. String annotations are resolved
+    first, so forward references and postponed annotations work.
+
+    :raises NameError: if an annotation can't be resolved (yet)
+    :return: Tuple of (positional indices, index of hinted varargs or
+             None, keyword names)
+    """
+    positions = []
+    var_index = None
+    kw_names = []
+
+    hints = (type_hint, typing.Union[type_hint, None])
+    annotations = typing.get_type_hints(func)
+    params = list(inspect.signature(func).parameters.values())
+
+    for idx, param in enumerate(params):
+        if annotations.get(param.name) not in hints:
+            continue
+
+        if param.kind == param.VAR_POSITIONAL:
+            var_index = idx
+            continue
+
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            positions.append(idx)
+
+        if param.kind != param.POSITIONAL_ONLY:
+            kw_names.append(param.name)
+
+    if len(positions) == 0 and var_index is None and len(kw_names) == 0:
+        raise ValueError("No arguments with %s hint found" % type_hint)
+
+    return tuple(positions), var_index, tuple(kw_names)
+
 
 def autocast_decorator(type_hint, fix_arg_func):
     """
@@ -39,42 +77,50 @@ def autocast_decorator(type_hint, fix_arg_func):
     arguments annotated with type_hint. The decorated
     function will then be called with the result.
 
+    The position of each argument is worked out once, when
+    the function is decorated, so each call only walks the
+    arguments. If an annotation refers to a name which isn't
+    defined yet, such as the class of a method, this happens
+    on the first call instead. If varargs are annotated, every
+    one of them is converted.
+
     :param type_hint: A PEP484 type hint
     :param fix_arg_func: Function to invoke
 
     :return: decorator
     """
-    @decorator
-    def wrapper(wrapped, instance, args, kwargs):
-        hinted_args = names = None
-        cache_key = '%s-%s-%s' % (wrapped.__class__.__name__,
-                                  wrapped.__name__, str(type_hint))
+    def autocast(func):
+        try:
+            plan = _autocast_plan(func, type_hint)
+        except NameError:
+            plan = None
 
-        if cache_key in AUTOCAST_CACHE:
-            hinted_args, names = AUTOCAST_CACHE[cache_key]
-        else:
-            sig = inspect.signature(wrapped)
-            names = list(sig.parameters.keys())
-            hinted_args = [x[0] for x in typing.get_type_hints(wrapped).items() \
-                    if x[1] == type_hint or x[1] == typing.Union[type_hint, None]]
-            AUTOCAST_CACHE[cache_key] = hinted_args, names
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal plan
+            if plan is None:
+                plan = _autocast_plan(func, type_hint)
+            positions, var_index, kw_names = plan
+
+            if len(args) > 0:
+                args = list(args)
+                for idx in positions:
+                    if idx < len(args):
+                        args[idx] = fix_arg_func(args[idx])
 
-        if len(hinted_args) == 0:
-            raise ValueError("No arguments with %s hint found" % type_hint)
+                if var_index is not None:
+                    for idx in range(var_index, len(args)):
+                        args[idx] = fix_arg_func(args[idx])
 
-        new_args = list(args)
-        for hinted_arg in hinted_args:
-            if hinted_arg in kwargs:
-                kwargs[hinted_arg] = fix_arg_func(kwargs[hinted_arg])
+            for name in kw_names:
+                if name in kwargs:
+                    kwargs[name] = fix_arg_func(kwargs[name])
 
-            elif hinted_arg in names:
-                idx = names.index(hinted_arg)
-                if idx < len(new_args):
-                    new_args[idx] = fix_arg_func(new_args[idx])
+            return func(*args, **kwargs)
 
-        return wrapped(*new_args, **kwargs)
+        return wrapper
 
-    return wrapper
+    return autocast
 
 
 def snake_to_camel(name: str) -> str:
@@ -335,6 +381,93 @@ class Singleton(type):
             return cls.__instance
 
 
+class Histogram(object):
+    """
+    Fixed-size histogram of durations
+
+    Values are counted into buckets with fixed upper bounds (in
+    milliseconds), so recording is cheap and memory use is constant
+    no matter how long it runs.
+    """
+
+    # upper bounds of the buckets in milliseconds, tuned for frame times
+    DEFAULT_BOUNDS = (0.5, 1, 2, 4, 8, 16, 33, 66, 133)
+
+    def __init__(self, bounds: tuple=None):
+        if bounds is None:
+            bounds = Histogram.DEFAULT_BOUNDS
+        self._bounds = tuple(bounds)
+        self.reset()
+
+
+    def reset(self):
+        """
+        Clear all recorded values
+        """
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+
+    def record(self, value: float):
+        """
+        Record a duration
+
+        :param value: Duration in seconds
+        """
+        value *= 1000.0
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+
+    @property
+    def count(self) -> int:
+        """
+        Number of values recorded
+        """
+        return self._count
+
+
+    @property
+    def mean(self) -> float:
+        """
+        Mean of all recorded values, in milliseconds
+        """
+        if self._count == 0:
+            return 0.0
+        return self._total / self._count
+
+
+    @property
+    def max(self) -> float:
+        """
+        Largest recorded value, in milliseconds
+        """
+        return self._max
+
+
+    @property
+    def buckets(self) -> OrderedDict:
+        """
+        Count of values in each bucket, keyed by the upper bound
+        """
+        keys = ['<=%gms' % bound for bound in self._bounds] + \
+                ['>%gms' % self._bounds[-1]]
+        return OrderedDict(zip(keys, self._counts))
+
+
+    def as_dict(self) -> OrderedDict:
+        """
+        Summary of this histogram suitable for serialization
+        """
+        return OrderedDict([('count', self.count), ('mean', self.mean),
+                            ('max', self.max), ('buckets', self.buckets)])
+
+
 class Ticker(object):
     """
     Framerate synchronizer
@@ -447,3 +580,12 @@ class ValueAnimator(object):
                 self._task.add_done_callback(done_cb)
         else:
             self._callback(end)
+
+
+    def cancel(self):
+        """
+        Stops the animation in progress, if any
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None